@@ -8,13 +8,20 @@ hashes.
 
 Public API:
     - compute_asset_hash(): Compute SHA-256 hash of normalized asset metadata
+    - compute_asset_hashes(): Compute SHA-256 hashes for a batch of assets
+    - compute_asset_hash_cached(): Compute a hash memoized under a caller key
+    - clear_hash_cache(): Reset the compute_asset_hash_cached() cache
     - are_assets_equal_by_hash(): Compare two assets by their material content
     - normalize_asset(): Normalize an asset for hashing
     - get_asset_hash_components(): Get normalized form for debugging
+    - AssetMetadata, NormalizedAsset: TypedDict shapes of raw and normalized assets
 """
 
 from .hasher import (
     compute_asset_hash,
+    compute_asset_hashes,
+    compute_asset_hash_cached,
+    clear_hash_cache,
     are_assets_equal_by_hash,
     get_asset_hash_components,
 )
@@ -24,6 +31,7 @@ from .normalizer import (
     get_volatile_fields,
     is_volatile_field,
 )
+from .models import AssetMetadata, NormalizedAsset
 from .decision import (
     DecisionResult,
     decide_reprocess_or_skip,
@@ -31,12 +39,17 @@ from .decision import (
 
 __all__ = [
     "compute_asset_hash",
+    "compute_asset_hashes",
+    "compute_asset_hash_cached",
+    "clear_hash_cache",
     "are_assets_equal_by_hash",
     "get_asset_hash_components",
     "normalize_asset",
     "get_material_fields",
     "get_volatile_fields",
     "is_volatile_field",
+    "AssetMetadata",
+    "NormalizedAsset",
     "DecisionResult",
     "decide_reprocess_or_skip",
 ]
@@ -20,9 +20,35 @@ class DecisionResult(str, Enum):
     SKIP = "SKIP"
 
 
+def _previous_hash_from_str(previous_state: str) -> Optional[str]:
+    """Previous state given directly as a hash string."""
+    return previous_state
+
+
+def _previous_hash_from_bytes(previous_state: bytes) -> Optional[str]:
+    """Previous state given as a raw digest; compare in hex form."""
+    return previous_state.hex()
+
+
+def _previous_hash_from_dict(previous_state: Dict[str, Any]) -> Optional[str]:
+    """Previous state given as a dict; look for common keys, ignore non-strings."""
+    candidate = previous_state.get("hash")
+    if not isinstance(candidate, str) or not candidate:
+        candidate = previous_state.get("previousHash")
+    return candidate if isinstance(candidate, str) else None
+
+
+# Exact-type dispatch for the supported previous-state shapes
+_PREVIOUS_HASH_EXTRACTORS = {
+    str: _previous_hash_from_str,
+    bytes: _previous_hash_from_bytes,
+    dict: _previous_hash_from_dict,
+}
+
+
 def decide_reprocess_or_skip(
-    current_hash: str,
-    previous_state: Optional[Union[str, Dict[str, Any]]] = None,
+    current_hash: Union[str, bytes],
+    previous_state: Optional[Union[str, bytes, Dict[str, Any]]] = None,
 ) -> DecisionResult:
     """
     Decide whether to REPROCESS or SKIP based on hash comparison.
@@ -34,20 +60,24 @@ def decide_reprocess_or_skip(
     - Invalid/incomplete previous state → REPROCESS (safe default)
 
     Args:
-        current_hash: The current asset hash (64-char lowercase hex expected)
-        previous_state: Either a previous hash string, a dict containing a
-            previous hash (e.g., {'hash': '...'} or {'previousHash': '...'}),
-            or None if no prior state exists
+        current_hash: The current asset hash (64-char lowercase hex expected),
+            or the raw digest bytes
+        previous_state: Either a previous hash string or raw digest bytes, a
+            dict containing a previous hash string (e.g., {'hash': '...'} or
+            {'previousHash': '...'}), or None if no prior state exists
 
     Returns:
         DecisionResult: REPROCESS or SKIP
 
     Raises:
-        TypeError: If current_hash is not a string
+        TypeError: If current_hash is not a string or bytes
     """
-    if not isinstance(current_hash, str):
+    if isinstance(current_hash, bytes):
+        # Raw digests compare in the same hex form that is persisted
+        current_hash = current_hash.hex()
+    elif not isinstance(current_hash, str):
         raise TypeError(
-            f"current_hash must be a str, got {type(current_hash).__name__}"
+            f"current_hash must be a str or bytes, got {type(current_hash).__name__}"
         )
 
     # No previous state → REPROCESS
@@ -55,17 +85,17 @@ def decide_reprocess_or_skip(
         return DecisionResult.REPROCESS
 
     # Extract previous hash from supported shapes
-    if isinstance(previous_state, str):
-        previous_hash = previous_state
-    elif isinstance(previous_state, dict):
-        # Look for common keys; ignore non-string values
-        candidate = previous_state.get("hash")
-        if not isinstance(candidate, str) or not candidate:
-            candidate = previous_state.get("previousHash")
-        previous_hash = candidate if isinstance(candidate, str) else None
-    else:
-        # Unsupported type → safe default
-        previous_hash = None
+    extract = _PREVIOUS_HASH_EXTRACTORS.get(type(previous_state))
+    if extract is None:
+        # Subclasses of supported types (e.g. OrderedDict) are still accepted
+        if isinstance(previous_state, str):
+            extract = _previous_hash_from_str
+        elif isinstance(previous_state, bytes):
+            extract = _previous_hash_from_bytes
+        elif isinstance(previous_state, dict):
+            extract = _previous_hash_from_dict
+    # Unsupported type → safe default
+    previous_hash = extract(previous_state) if extract is not None else None
 
     # Invalid or missing previous hash → REPROCESS (safe default)
     if not previous_hash:
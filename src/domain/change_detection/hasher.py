@@ -8,11 +8,64 @@ produce identical hashes.
 
 import hashlib
 import json
-from typing import Any, Dict
+import threading
+from collections import OrderedDict
+from json.encoder import encode_basestring
+from typing import Any, Dict, Hashable, Iterator, List, Set
 
+from .models import NormalizedAsset
 from .normalizer import normalize_asset
 
 
+def _json_encoder_default(obj: Any) -> Any:
+    """
+    Custom JSON encoder for non-standard types.
+
+    Args:
+        obj: The object to encode
+
+    Returns:
+        A JSON-serializable representation
+
+    Raises:
+        TypeError: If the object type is not supported
+    """
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Canonical JSON encoder, built once at import time. ``json.dumps`` with
+# non-default options constructs a fresh JSONEncoder on every call; reusing a
+# single configured instance keeps the C-accelerated one-shot path while
+# avoiding that per-hash setup cost. Output is byte-identical to the previous
+# ``json.dumps(..., sort_keys=True)`` call, so stored hashes remain valid.
+_CANONICAL_ENCODER = json.JSONEncoder(
+    separators=(",", ":"),
+    sort_keys=True,
+    ensure_ascii=False,
+    default=_json_encoder_default,
+)
+
+
+# Bounded LRU of hashes keyed by caller-supplied cache keys, used by
+# compute_asset_hash_cached(). Set _HASH_CACHE_ENABLED to False to bypass it.
+_HASH_CACHE_ENABLED = True
+_HASH_CACHE_MAXSIZE = 4096
+_hash_cache: "OrderedDict[Hashable, str]" = OrderedDict()
+_hash_cache_lock = threading.Lock()
+
+# Normalized assets whose estimated serialized size reaches this many
+# characters are streamed into the hash instead of encoded as one document.
+# While streaming, values below _STREAM_PIECE_SIZE characters are encoded
+# whole, larger ones are split (strings into slices of that many characters).
+_STREAMING_THRESHOLD = 64 * 1024
+_STREAM_PIECE_SIZE = 1024
+_STREAM_FLUSH_SIZE = 4096
+# Top-level lists and dicts with fewer items than this are not walked when
+# deciding whether to stream, which keeps that check constant-time for
+# ordinary assets.
+_STREAM_WALK_MIN_ITEMS = 256
+
+
 def compute_asset_hash(asset: Dict[str, Any]) -> str:
     """
     Compute a deterministic SHA-256 hash of an asset's metadata.
@@ -43,60 +96,274 @@ def compute_asset_hash(asset: Dict[str, Any]) -> str:
     # Normalize the asset
     normalized = normalize_asset(asset)
 
-    # Serialize deterministically to JSON
+    # Large assets: stream the canonical JSON into the hash piece by piece
+    if _should_stream(normalized):
+        return _hash_canonical_streaming(normalized)
+
+    # Serialize deterministically to canonical JSON bytes
     canonical_json = _to_canonical_json(normalized)
 
-    # Compute SHA-256 hash
-    hash_obj = hashlib.sha256(canonical_json.encode("utf-8"))
+    # Compute SHA-256 hash (OpenSSL EVP; uses SHA-NI when the CPU has it)
+    hash_obj = hashlib.sha256(canonical_json)
     return hash_obj.hexdigest()
 
 
-def _to_canonical_json(obj: Any) -> str:
+def _should_stream(normalized: Dict[str, Any]) -> bool:
     """
-    Serialize an object to canonical JSON representation.
+    Decide whether a normalized asset is large enough to stream.
 
-    Canonical JSON has the following properties:
-    - No whitespace (compact)
-    - Keys are sorted alphabetically (for determinism)
-    - Uses UTF-8 encoding
-    - Separators are fixed (no spaces after comma or colon)
+    Only top-level values are inspected: string lengths are summed, and a
+    list or dict is walked only when it has at least
+    ``_STREAM_WALK_MIN_ITEMS`` items. Values nested in a short collection
+    are not counted, so such an asset is encoded in one piece; the hash is
+    the same either way.
+    """
+    size = 0
+    for value in normalized.values():
+        if isinstance(value, str):
+            size += len(value)
+        elif isinstance(value, (list, dict)) and len(value) >= _STREAM_WALK_MIN_ITEMS:
+            size += _estimate_canonical_size(value, _STREAMING_THRESHOLD - size)
+        if size >= _STREAMING_THRESHOLD:
+            return True
+    return False
+
+
+def _estimate_canonical_size(value: Any, limit: int) -> int:
+    """
+    Cheaply estimate the serialized size of a value, in characters.
+
+    Walks nested lists and dicts, counting key and string lengths plus a
+    few characters per item, and stops once the running total reaches
+    *limit*, so the cost is bounded by the limit rather than by the value.
+    Used to decide whether streaming is worthwhile, not for exact sizing.
+    """
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            size += len(item) + 2
+        elif isinstance(item, dict):
+            size += 2
+            for key, child in item.items():
+                size += (len(key) if isinstance(key, str) else 8) + 4
+                stack.append(child)
+        elif isinstance(item, (list, tuple)):
+            size += 2 + len(item)
+            stack.extend(item)
+        else:
+            size += 8
+        if size >= limit:
+            break
+    return size
+
+
+def _hash_canonical_streaming(normalized: Dict[str, Any]) -> str:
+    """
+    Hash the canonical JSON of a normalized asset without materializing it.
+
+    Emits the same bytes as _to_canonical_json(), piece by piece (see
+    _iter_canonical_pieces()), into a buffer that is fed to the hash every
+    ``_STREAM_FLUSH_SIZE`` bytes. Long strings are encoded in slices and
+    large lists and objects are walked item by item, so peak memory stays
+    bounded by the piece and flush sizes however the bulk of the asset is
+    nested.
 
     Args:
-        obj: The object to serialize
+        normalized: A normalized asset dictionary (string keys)
 
     Returns:
-        Canonical JSON string
+        SHA-256 hash as a lowercase hexadecimal string (64 characters)
 
     Raises:
-        TypeError: If the object contains non-JSON-serializable types
-        ValueError: If serialization fails
+        ValueError: If a value cannot be serialized to JSON
     """
-    try:
-        return json.dumps(
-            obj,
-            separators=(",", ":"),
-            sort_keys=True,
-            ensure_ascii=False,
-            default=_json_encoder_default,
-        )
-    except (TypeError, ValueError) as e:
-        raise ValueError(f"Failed to serialize to canonical JSON: {e}") from e
+    hash_obj = hashlib.sha256()
+    buffer = bytearray()
+    for piece in _iter_canonical_pieces(normalized, set()):
+        buffer += piece
+        if len(buffer) >= _STREAM_FLUSH_SIZE:
+            hash_obj.update(buffer)
+            buffer.clear()
+    hash_obj.update(buffer)
+    return hash_obj.hexdigest()
 
 
-def _json_encoder_default(obj: Any) -> Any:
+def _iter_canonical_pieces(value: Any, active: Set[int]) -> Iterator[bytes]:
     """
-    Custom JSON encoder for non-standard types.
+    Yield the canonical JSON of *value* as consecutive UTF-8 pieces.
+
+    Values estimated below ``_STREAM_PIECE_SIZE`` characters, and objects
+    with non-string keys, are encoded whole by the canonical encoder.
+    Larger strings are escaped slice by slice (JSON escaping is per
+    character, so slices concatenate to the whole), and larger lists and
+    string-keyed objects are emitted item by item, keys sorted as with
+    ``sort_keys=True``. *active* holds the ids of the containers being
+    emitted, to reject circular references as the encoder does.
+
+    Raises:
+        ValueError: If the value cannot be serialized to JSON
+    """
+    if _estimate_canonical_size(value, _STREAM_PIECE_SIZE) < _STREAM_PIECE_SIZE:
+        yield _to_canonical_json(value)
+        return
+
+    if isinstance(value, str):
+        yield b'"'
+        for start in range(0, len(value), _STREAM_PIECE_SIZE):
+            chunk = value[start:start + _STREAM_PIECE_SIZE]
+            try:
+                yield encode_basestring(chunk)[1:-1].encode("utf-8")
+            except UnicodeEncodeError as e:
+                raise ValueError(f"Failed to serialize to canonical JSON: {e}") from e
+        yield b'"'
+        return
+
+    if isinstance(value, dict) and not all(isinstance(key, str) for key in value):
+        # Key coercion and ordering are left to the encoder
+        yield _to_canonical_json(value)
+        return
+
+    if not isinstance(value, (dict, list, tuple)):
+        yield _to_canonical_json(value)
+        return
+
+    marker = id(value)
+    if marker in active:
+        raise ValueError("Failed to serialize to canonical JSON: Circular reference detected")
+    active.add(marker)
+
+    if isinstance(value, dict):
+        yield b"{"
+        for index, key in enumerate(sorted(value)):
+            if index:
+                yield b","
+            yield _to_canonical_json(key)
+            yield b":"
+            yield from _iter_canonical_pieces(value[key], active)
+        yield b"}"
+    else:
+        yield b"["
+        for index, item in enumerate(value):
+            if index:
+                yield b","
+            yield from _iter_canonical_pieces(item, active)
+        yield b"]"
+
+    active.discard(marker)
+
+
+def compute_asset_hashes(assets: List[Dict[str, Any]]) -> List[str]:
+    """
+    Compute deterministic SHA-256 hashes for a batch of assets.
+
+    Batch entry point for scans that hash many assets at once. Each asset is
+    normalized and serialized exactly as in compute_asset_hash(), so
+    ``compute_asset_hashes(assets)[i] == compute_asset_hash(assets[i])``.
+    Results are returned in input order.
+
+    Hashing currently runs one asset at a time through ``hashlib.sha256``;
+    the batch API gives callers a single seam should a multi-buffer SHA-256
+    backend become available.
 
     Args:
-        obj: The object to encode
+        assets: List of asset metadata dictionaries to hash
 
     Returns:
-        A JSON-serializable representation
+        List of SHA-256 hashes (64-character lowercase hex), one per asset
 
     Raises:
-        TypeError: If the object type is not supported
+        TypeError: If assets is not a list or any asset is not a dictionary
+        ValueError: If an asset cannot be serialized to JSON
     """
-    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    if not isinstance(assets, list):
+        raise TypeError(f"Expected list, got {type(assets).__name__}")
+
+    return [compute_asset_hash(asset) for asset in assets]
+
+
+def compute_asset_hash_cached(asset: Dict[str, Any], cache_key: Hashable) -> str:
+    """
+    Compute an asset hash, memoized under a caller-supplied cache key.
+
+    Intended for retry loops and idempotent rescans that hash the same asset
+    repeatedly. The caller owns invalidation: the key must change whenever
+    the asset's material content may have changed, e.g.
+    ``(asset["id"], asset["lastUpdated"])``. On a hit the cached hash is
+    returned without normalizing, serializing, or hashing the asset.
+
+    The cache is a bounded LRU (``_HASH_CACHE_MAXSIZE`` entries); call
+    clear_hash_cache() to reset it.
+
+    Args:
+        asset: The asset metadata dictionary to hash
+        cache_key: Hashable key identifying this version of the asset
+
+    Returns:
+        SHA-256 hash as a lowercase hexadecimal string (64 characters)
+
+    Raises:
+        TypeError: If asset is not a dictionary or cache_key is unhashable
+        ValueError: If the asset cannot be serialized to JSON
+    """
+    if not _HASH_CACHE_ENABLED:
+        return compute_asset_hash(asset)
+
+    with _hash_cache_lock:
+        cached = _hash_cache.get(cache_key)
+        if cached is not None:
+            _hash_cache.move_to_end(cache_key)
+            return cached
+
+    hash_value = compute_asset_hash(asset)
+
+    with _hash_cache_lock:
+        _hash_cache[cache_key] = hash_value
+        _hash_cache.move_to_end(cache_key)
+        if len(_hash_cache) > _HASH_CACHE_MAXSIZE:
+            _hash_cache.popitem(last=False)
+    return hash_value
+
+
+def clear_hash_cache() -> None:
+    """Remove all entries from the compute_asset_hash_cached() cache."""
+    with _hash_cache_lock:
+        _hash_cache.clear()
+
+
+def _to_canonical_json(obj: Any) -> bytes:
+    """
+    Serialize an object to canonical JSON representation.
+
+    Canonical JSON has the following properties:
+    - No whitespace (compact)
+    - Keys are sorted alphabetically (for determinism)
+    - Uses UTF-8 encoding
+    - Separators are fixed (no spaces after comma or colon)
+
+    The result is returned as UTF-8 bytes so it can be fed straight into
+    the hash function.
+
+    Third-party encoders such as orjson are intentionally not used: they
+    format some values differently (e.g. ``1e16`` vs ``1e+16``, ``NaN`` as
+    ``null``) and reject integers outside 64 bits, which would silently
+    change previously stored hashes.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        Canonical JSON as UTF-8 encoded bytes
+
+    Raises:
+        ValueError: If the object contains non-JSON-serializable types or
+            cannot be encoded
+    """
+    try:
+        return _CANONICAL_ENCODER.encode(obj).encode("utf-8")
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Failed to serialize to canonical JSON: {e}") from e
 
 
 def are_assets_equal_by_hash(asset1: Dict[str, Any], asset2: Dict[str, Any]) -> bool:
@@ -106,6 +373,14 @@ def are_assets_equal_by_hash(asset1: Dict[str, Any], asset2: Dict[str, Any]) ->
     This is a convenience function for determining if two assets represent
     the same logical state.
 
+    Both assets are validated by normalization before any shortcut is
+    taken, so malformed assets raise TypeError as compute_asset_hash()
+    would. After that, the same object is equal to itself without being
+    normalized twice, and assets with different string ids are unequal
+    without being serialized. Otherwise the canonical JSON bytes are
+    compared directly, which is exactly the condition under which their
+    SHA-256 hashes match; large assets are compared by streamed hash.
+
     Args:
         asset1: First asset dictionary
         asset2: Second asset dictionary
@@ -114,14 +389,34 @@ def are_assets_equal_by_hash(asset1: Dict[str, Any], asset2: Dict[str, Any]) ->
         True if the hashes are equal (same logical content), False otherwise
 
     Raises:
-        TypeError: If either asset is not a dictionary
+        TypeError: If either asset is not a dictionary or fails normalization
+        ValueError: If an asset cannot be serialized to JSON; not raised
+            when the identity or id shortcut decides the result first
     """
-    hash1 = compute_asset_hash(asset1)
-    hash2 = compute_asset_hash(asset2)
-    return hash1 == hash2
+    for asset in (asset1, asset2):
+        if not isinstance(asset, dict):
+            raise TypeError(f"Expected dict, got {type(asset).__name__}")
+
+    normalized1 = normalize_asset(asset1)
+    if asset1 is asset2:
+        return True
+    normalized2 = normalize_asset(asset2)
+
+    # String ids are material and kept as-is, so different ones never hash
+    # the same
+    id1 = normalized1.get("id")
+    id2 = normalized2.get("id")
+    if type(id1) is str and type(id2) is str and id1 != id2:
+        return False
+
+    if _should_stream(normalized1) or _should_stream(normalized2):
+        return _hash_canonical_streaming(normalized1) == _hash_canonical_streaming(normalized2)
+
+    # Same canonical bytes <=> same SHA-256 input; no digest is needed
+    return _to_canonical_json(normalized1) == _to_canonical_json(normalized2)
 
 
-def get_asset_hash_components(asset: Dict[str, Any]) -> Dict[str, Any]:
+def get_asset_hash_components(asset: Dict[str, Any]) -> NormalizedAsset:
     """
     Get the normalized components that will be hashed for an asset.
 
@@ -0,0 +1,49 @@
+"""
+Typed shapes for change-detection assets.
+
+These are ``TypedDict`` declarations only: assets stay plain dicts at
+runtime (they arrive as parsed JSON and are hashed as JSON), so there is no
+conversion cost and every existing caller keeps working. The types document
+the contract in ``asset_contract.md`` for readers and static checkers.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, TypedDict
+
+
+class NormalizedAsset(TypedDict, total=False):
+    """Canonical form returned by ``normalize_asset()``.
+
+    Only material fields appear, and only when present and non-empty.
+    Collections are sorted: ``tags`` case-insensitively, ``relationships``
+    by ``id`` and ``columns`` by ``name``.
+    """
+
+    businessMeaning: str
+    columns: List[Dict[str, Any]]
+    content: str
+    dataType: str
+    description: str
+    domain: str
+    elementName: str
+    entityPath: str
+    entityType: str
+    id: str
+    relationships: List[Dict[str, Any]]
+    sourceSystem: str
+    tags: List[str]
+
+
+class AssetMetadata(NormalizedAsset, total=False):
+    """Raw asset as scanned, before normalization.
+
+    Adds the volatile fields that are accepted but excluded from hashing.
+    Fields prefixed with ``_`` are also accepted and excluded.
+    """
+
+    auditInfo: Any
+    ingestionTime: str
+    lastUpdated: str
+    scanId: str
+    schemaVersion: str
@@ -6,38 +6,52 @@ and sorting collections to ensure identical logical assets produce identical
 canonical representations.
 """
 
-from typing import Any, Dict, List, Optional
-from copy import deepcopy
+import sys
+from typing import Any, Dict, List, Optional, cast
+
+from .models import NormalizedAsset
 
 
 # Material fields that are included in change detection
-MATERIAL_FIELDS = {
-    "id",
-    "sourceSystem",
-    "entityType",
-    "elementName",
-    "entityPath",
-    "description",
-    "businessMeaning",
-    "domain",
-    "tags",
-    "content",
-    "relationships",
-    "columns",
-    "dataType",
-}
+MATERIAL_FIELDS = frozenset(
+    {
+        "id",
+        "sourceSystem",
+        "entityType",
+        "elementName",
+        "entityPath",
+        "description",
+        "businessMeaning",
+        "domain",
+        "tags",
+        "content",
+        "relationships",
+        "columns",
+        "dataType",
+    }
+)
+
+# Material fields in canonical (sorted) order, so normalized dicts are built
+# with deterministic key order regardless of set iteration order
+_MATERIAL_FIELDS_ORDERED = tuple(sorted(MATERIAL_FIELDS))
+
+# Low-cardinality scalar fields whose values repeat across most assets of a
+# scan; normalized values are interned so they share one string object
+_INTERNED_FIELDS = frozenset({"sourceSystem", "entityType", "domain", "dataType"})
 
 # Fields to exclude from change detection (volatile or infrastructure-related)
-VOLATILE_FIELDS = {
-    "lastUpdated",
-    "schemaVersion",
-    "auditInfo",
-    "scanId",
-    "ingestionTime",
-}
-
-
-def normalize_asset(asset: Dict[str, Any]) -> Dict[str, Any]:
+VOLATILE_FIELDS = frozenset(
+    {
+        "lastUpdated",
+        "schemaVersion",
+        "auditInfo",
+        "scanId",
+        "ingestionTime",
+    }
+)
+
+
+def normalize_asset(asset: Dict[str, Any]) -> NormalizedAsset:
     """
     Normalize an asset by removing volatile fields and sorting collections
     deterministically.
@@ -45,6 +59,7 @@ def normalize_asset(asset: Dict[str, Any]) -> Dict[str, Any]:
     This function produces a canonical representation of an asset that is
     suitable for deterministic hashing. It:
     - Removes all non-material and volatile fields
+    - Omits missing and None values; empty strings and collections are kept
     - Sorts all collections deterministically
     - Returns a clean dictionary with fields in canonical order
 
@@ -61,16 +76,16 @@ def normalize_asset(asset: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(asset, dict):
         raise TypeError(f"Expected dict, got {type(asset).__name__}")
 
-    normalized = {}
-
-    # Extract material fields, maintaining their logical meaning
-    for field in MATERIAL_FIELDS:
-        if field not in asset:
-            continue
+    normalized: Dict[str, Any] = {}
 
-        value = asset[field]
+    # Extract material fields, maintaining their logical meaning. Volatile,
+    # underscore-prefixed and unknown keys are never visited, so nothing has
+    # to be stripped afterwards.
+    get = asset.get
+    for field in _MATERIAL_FIELDS_ORDERED:
+        value = get(field)
 
-        # Skip None values or empty strings for non-required fields
+        # Skip missing and None values
         if value is None:
             continue
 
@@ -81,11 +96,13 @@ def normalize_asset(asset: Dict[str, Any]) -> Dict[str, Any]:
             normalized[field] = _normalize_relationships(value)
         elif field == "columns":
             normalized[field] = _normalize_columns(value)
+        elif field in _INTERNED_FIELDS and type(value) is str:
+            normalized[field] = sys.intern(value)
         else:
             # For scalar fields, include as-is
             normalized[field] = value
 
-    return normalized
+    return cast(NormalizedAsset, normalized)
 
 
 def _normalize_tags(tags: Any) -> List[str]:
@@ -96,7 +113,8 @@ def _normalize_tags(tags: Any) -> List[str]:
         tags: List of tag strings
 
     Returns:
-        Sorted list of tags (case-insensitive sort)
+        Sorted list of tags (case-insensitive sort, ties broken by exact
+        value)
 
     Raises:
         TypeError: If tags is not a list or if items are not strings
@@ -104,13 +122,30 @@ def _normalize_tags(tags: Any) -> List[str]:
     if not isinstance(tags, list):
         raise TypeError(f"Expected list for tags, got {type(tags).__name__}")
 
-    # Validate all items are strings
+    # Validate all items are strings, noting whether the list is already
+    # strictly ascending in canonical order, i.e. sorted and duplicate-free
+    canonical = True
+    prev_tag = None
+    prev_key = None
     for i, tag in enumerate(tags):
         if not isinstance(tag, str):
             raise TypeError(f"Tag at index {i} is not a string: {type(tag).__name__}")
+        key = tag.lower()
+        if canonical and prev_key is not None and (
+            key < prev_key or (key == prev_key and tag <= prev_tag)
+        ):
+            canonical = False
+        prev_tag = tag
+        prev_key = key
+
+    # Already canonical: skip building the set and sorting
+    if canonical:
+        return list(tags)
 
-    # Sort case-insensitively but preserve original case
-    return sorted(set(tags), key=str.lower)
+    # Sort case-insensitively but preserve original case. Tags that differ
+    # only in case are ordered by their exact value first (the outer sort is
+    # stable), so the result never depends on set iteration order.
+    return sorted(sorted(set(tags)), key=str.lower)
 
 
 def _normalize_relationships(relationships: Any) -> List[Dict[str, Any]]:
@@ -132,12 +167,24 @@ def _normalize_relationships(relationships: Any) -> List[Dict[str, Any]]:
             f"Expected list for relationships, got {type(relationships).__name__}"
         )
 
-    # Validate that each relationship has an id
+    # Validate that each relationship has an id, noting whether the ids are
+    # already strictly ascending strings (sorted and duplicate-free)
+    canonical = True
+    prev_id = None
     for i, rel in enumerate(relationships):
         if not isinstance(rel, dict):
             raise TypeError(f"Relationship at index {i} is not a dict")
         if "id" not in rel:
             raise ValueError(f"Relationship at index {i} lacks required 'id' field")
+        if canonical:
+            rel_id = rel["id"]
+            if type(rel_id) is not str or (prev_id is not None and rel_id <= prev_id):
+                canonical = False
+            prev_id = rel_id
+
+    # Already canonical: skip de-duplication and sorting
+    if canonical:
+        return list(relationships)
 
     # Sort by id, removing duplicates by id
     seen = set()
@@ -168,12 +215,24 @@ def _normalize_columns(columns: Any) -> List[Dict[str, Any]]:
     if not isinstance(columns, list):
         raise TypeError(f"Expected list for columns, got {type(columns).__name__}")
 
-    # Validate that each column has a name
+    # Validate that each column has a name, noting whether the names are
+    # already strictly ascending strings (sorted and duplicate-free)
+    canonical = True
+    prev_name = None
     for i, col in enumerate(columns):
         if not isinstance(col, dict):
             raise TypeError(f"Column at index {i} is not a dict")
         if "name" not in col:
             raise ValueError(f"Column at index {i} lacks required 'name' field")
+        if canonical:
+            col_name = col["name"]
+            if type(col_name) is not str or (prev_name is not None and col_name <= prev_name):
+                canonical = False
+            prev_name = col_name
+
+    # Already canonical: skip de-duplication and sorting
+    if canonical:
+        return list(columns)
 
     # Sort by name, removing duplicates by name
     seen = set()
@@ -208,7 +267,7 @@ def get_material_fields() -> frozenset:
     Returns:
         Frozenset of material field names
     """
-    return frozenset(MATERIAL_FIELDS)
+    return MATERIAL_FIELDS
 
 
 def get_volatile_fields() -> frozenset:
@@ -218,4 +277,4 @@ def get_volatile_fields() -> frozenset:
     Returns:
         Frozenset of volatile field names
     """
-    return frozenset(VOLATILE_FIELDS)
+    return VOLATILE_FIELDS
@@ -0,0 +1,64 @@
+"""Immutable model of a parsed LLM suggestion.
+
+Used as a hashable input to the semantic validator. No validation rules
+live here; see semantic_validator for those.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Suggestion:
+    """Parsed LLM output: the four contract fields in contract order.
+
+    Immutable and hashable, so it can be passed to validate_semantic()
+    and used directly as its memoization key. Arrays are stored as tuples;
+    to_dict() gives the list-based form the parser produces.
+
+    This model does not validate content; semantic rules still apply.
+    Field types are checked on construction.
+    """
+
+    suggested_description: str
+    confidence: str
+    used_sources: Tuple[str, ...]
+    warnings: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.suggested_description, str):
+            raise TypeError("suggested_description must be a string")
+        if not isinstance(self.confidence, str):
+            raise TypeError("confidence must be a string")
+        for name in ("used_sources", "warnings"):
+            value = getattr(self, name)
+            if not isinstance(value, tuple) or not all(isinstance(v, str) for v in value):
+                raise TypeError(f"{name} must be a tuple of strings")
+
+    @classmethod
+    def from_parsed(cls, parsed: Dict[str, Any]) -> "Suggestion":
+        """Build from a structurally valid parsed dict.
+
+        Raises KeyError if a required field is missing and TypeError if a
+        field has the wrong type.
+        """
+        used_sources = parsed["used_sources"]
+        warnings = parsed.get("warnings", [])
+        for name, value in (("used_sources", used_sources), ("warnings", warnings)):
+            if not isinstance(value, list):
+                raise TypeError(f"{name} must be an array")
+        return cls(
+            suggested_description=parsed["suggested_description"],
+            confidence=parsed["confidence"],
+            used_sources=tuple(used_sources),
+            warnings=tuple(warnings),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the parsed-dict form (arrays as lists)."""
+        return {
+            "suggested_description": self.suggested_description,
+            "confidence": self.confidence,
+            "used_sources": list(self.used_sources),
+            "warnings": list(self.warnings),
+        }
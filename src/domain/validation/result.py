@@ -1,8 +1,8 @@
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Validation outcome for a single LLM output.
 
@@ -10,7 +10,8 @@ class ValidationResult:
     - structural_errors: explicit reasons for structural rejection.
     - semantic_errors: explicit reasons for semantic rejection.
     
-    This model does not mutate or correct input.
+    This model does not mutate or correct input. Slotted: one instance is
+    created per validation, so no per-instance __dict__ is allocated.
     """
 
     is_valid: bool
@@ -18,7 +19,9 @@ class ValidationResult:
     semantic_errors: List[str] = field(default_factory=list)
 
     @classmethod
-    def invalid(cls, structural: List[str] = None, semantic: List[str] = None) -> "ValidationResult":
+    def invalid(
+        cls, structural: Optional[Sequence[str]] = None, semantic: Optional[Sequence[str]] = None
+    ) -> "ValidationResult":
         return cls(
             is_valid=False,
             structural_errors=list(structural or []),
@@ -1,6 +1,8 @@
 import re
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
 
+from .models import Suggestion
 from .result import ValidationResult
 
 
@@ -28,7 +30,7 @@ GENERIC_PATTERNS = [
     r"^\s*Dataset\s*(with)?\s*information\.?\s*$",
 ]
 
-CONFIDENCE_ALLOWED = {"low", "medium", "high"}
+CONFIDENCE_ALLOWED = frozenset({"low", "medium", "high"})
 
 # Speculative or disallowed phrasing in suggested_description per grounding rules and output contract
 FORBIDDEN_LANGUAGE = [
@@ -42,8 +44,128 @@ FORBIDDEN_LANGUAGE = [
     r"\bcould\b",
 ]
 
+FORBIDDEN_SOURCE_IDENTIFIERS = r"general knowledge|training data|internet|wikipedia"
 
-def validate_semantic(parsed_yaml: Dict[str, Any]) -> ValidationResult:
+
+def _compile_alternation(patterns: List[str]) -> "re.Pattern[str]":
+    """Compile a list of patterns into a single case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Compiled once at import: one scan per category instead of one re.search per pattern
+_GENERIC_RE = _compile_alternation(GENERIC_PATTERNS)
+_FORBIDDEN_SOURCE_RE = re.compile(FORBIDDEN_SOURCE_IDENTIFIERS, re.IGNORECASE)
+
+# Word-level description rules share a single scan; the named group that
+# matched identifies the category. The two vocabularies have no words in
+# common, so a match in one category can never mask a match in the other.
+_FORBIDDEN_CONCEPT = "forbidden_concept"
+_FORBIDDEN_LANGUAGE = "forbidden_language"
+_DESCRIPTION_RULES_RE = re.compile(
+    "|".join(
+        f"(?P<{category}>{'|'.join(f'(?:{p})' for p in patterns)})"
+        for category, patterns in (
+            (_FORBIDDEN_CONCEPT, FORBIDDEN_PHRASES),
+            (_FORBIDDEN_LANGUAGE, FORBIDDEN_LANGUAGE),
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
+# Literal substrings, one per pattern, that any match must contain (in
+# lowercase). A description containing none of them cannot match, so the
+# regex scan is skipped. Only applied to ASCII text, where lower() and
+# re.IGNORECASE agree character for character.
+_GENERIC_LITERALS = ("data", "report")
+
+
+def _may_contain(low: Optional[str], literals: Tuple[str, ...]) -> bool:
+    """Cheap prefilter: False only if the text cannot match any pattern.
+
+    *low* is the lowercased ASCII text, or None for non-ASCII text (which
+    always passes the filter).
+    """
+    if low is None:
+        return True
+    return any(w in low for w in literals)
+
+
+# Token view of the word-level rules, derived from the pattern lists. A
+# single-word \bword\b pattern matches exactly when 'word' is one of the \w+
+# runs of the text, so those become set lookups. A multi-word phrase that
+# contains one of its category's single words (e.g. "Azure OpenAI") needs no
+# entry of its own. The remaining phrases keep a regex, which only runs when
+# one of their anchor words (the longest word of each phrase) is present.
+_TOKEN_RE = re.compile(r"\w+")
+_WORD_PATTERN_RE = re.compile(r"\\b(\w+(?:\\s\+\w+)*)\\b")
+
+
+def _token_rules(
+    patterns: List[str],
+) -> Tuple[FrozenSet[str], FrozenSet[str], Optional["re.Pattern[str]"]]:
+    """Split word-level patterns into (words, anchors, phrase regex).
+
+    Every pattern must be \\b-delimited words joined by \\s+; anything else
+    raises ValueError at import, so a new rule cannot be silently skipped.
+    """
+    phrases: List[Tuple[str, List[str]]] = []
+    words: Set[str] = set()
+    for pattern in patterns:
+        m = _WORD_PATTERN_RE.fullmatch(pattern)
+        if m is None:
+            raise ValueError(f"Unsupported word-level pattern: {pattern!r}")
+        parts = m.group(1).lower().split(r"\s+")
+        if len(parts) == 1:
+            words.add(parts[0])
+        else:
+            phrases.append((pattern, parts))
+    phrases = [(p, parts) for p, parts in phrases if words.isdisjoint(parts)]
+    if not phrases:
+        return frozenset(words), frozenset(), None
+    anchors = frozenset(max(parts, key=len) for _, parts in phrases)
+    return frozenset(words), anchors, _compile_alternation([p for p, _ in phrases])
+
+
+_TOKEN_RULES = tuple(
+    (category, *_token_rules(patterns))
+    for category, patterns in (
+        (_FORBIDDEN_CONCEPT, FORBIDDEN_PHRASES),
+        (_FORBIDDEN_LANGUAGE, FORBIDDEN_LANGUAGE),
+    )
+)
+
+
+def _description_rule_hits(desc: str, low: Optional[str]) -> Set[str]:
+    """Return the word-level rule categories matched anywhere in *desc*.
+
+    ASCII text (the common case, passed lowercased as *low*) is tokenized
+    once and checked by set lookup; anything else (*low* is None) goes
+    through the combined regex, which stops scanning as soon as every
+    category has been seen.
+    """
+    hits: Set[str] = set()
+    if low is None:
+        for m in _DESCRIPTION_RULES_RE.finditer(desc):
+            hits.add(m.lastgroup)
+            if len(hits) == 2:
+                break
+        return hits
+
+    tokens = set(_TOKEN_RE.findall(low))
+    for category, words, anchors, phrase_re in _TOKEN_RULES:
+        if not words.isdisjoint(tokens) or (
+            phrase_re is not None
+            and not anchors.isdisjoint(tokens)
+            and phrase_re.search(desc)
+        ):
+            hits.add(category)
+    return hits
+
+
+def validate_semantic(
+    parsed_yaml: Union[Dict[str, Any], Suggestion], fast_fail: bool = False
+) -> ValidationResult:
     """Deterministic semantic validation.
 
     Preconditions: Structural validation passed and provided 'parsed_yaml'.
@@ -51,49 +173,211 @@ def validate_semantic(parsed_yaml: Dict[str, Any]) -> ValidationResult:
     - suggested_description: non-empty, length bounds, not trivially generic, no forbidden concepts
     - confidence: allowed closed set
     - used_sources: non-empty, strings, no forbidden source identifiers
+
+    With fast_fail=True, the constant-time checks (confidence value, description
+    presence and length, sources presence and type) run first and the first
+    failure is returned on its own; only then do the text scans run, stopping
+    after the first rule group (description, sources) that produced an error
+    and after the first bad source. Use it when only is_valid matters; the
+    default reports every error, in rule order.
+
+    parsed_yaml is the dict produced by structural validation or a
+    Suggestion. Well-typed inputs (string description and confidence, list
+    of string sources; every Suggestion) are memoized on their values;
+    other inputs, and descriptions over the 500-character cap, are checked
+    directly.
     """
-    errors: List[str] = []
+    if isinstance(parsed_yaml, Suggestion):
+        key = (parsed_yaml.suggested_description, parsed_yaml.confidence, parsed_yaml.used_sources)
+    else:
+        key = _semantic_cache_key(parsed_yaml)
+    # Errors stay in the cached tuple; invalid() makes the result's own
+    # list, so no intermediate copy is needed
+    errors: Sequence[str]
+    if key is None:
+        errors = _semantic_errors(parsed_yaml, fast_fail)
+    elif len(key[0]) > 500:
+        # Over-long descriptions always fail; caching them would let
+        # oversized outputs pin memory
+        errors = _semantic_errors_for_key(*key, fast_fail)
+    else:
+        errors = _semantic_errors_cached(*key, fast_fail)
+
+    if errors:
+        return ValidationResult.invalid(semantic=errors)
+    return ValidationResult.valid()
+
+
+def validate_semantic_batch(
+    items: List[Union[Dict[str, Any], Suggestion]], fast_fail: bool = False
+) -> List[ValidationResult]:
+    """Semantically validate many parsed outputs.
+
+    Batch entry point for runs that validate many assets at once.
+    Each item is checked exactly as by validate_semantic(), so
+    ``validate_semantic_batch(items)[i] == validate_semantic(items[i])``.
+    Results are returned in input order.
+
+    Duplicate outputs in a batch (common across LLM retries) share one
+    memoized check.
+
+    Raises:
+        TypeError: If items is not a list
+    """
+    if not isinstance(items, list):
+        raise TypeError(f"Expected list, got {type(items).__name__}")
+
+    return [validate_semantic(item, fast_fail=fast_fail) for item in items]
+
+
+# Bound on memoized semantic checks
+_SEMANTIC_CACHE_MAXSIZE = 1024
 
+
+def _semantic_cache_key(
+    parsed_yaml: Dict[str, Any]
+) -> Optional[Tuple[str, Optional[str], Tuple[str, ...]]]:
+    """Return the hashable (description, confidence, sources) key, or None.
+
+    Only exact str/list types are keyed, so values that hash alike but
+    validate differently (e.g. a tuple of sources vs a list) never share
+    an entry. A missing field and its default yield the same key, as they
+    validate the same.
+    """
     desc = parsed_yaml.get("suggested_description", "")
+    conf = parsed_yaml.get("confidence")
+    srcs = parsed_yaml.get("used_sources", [])
+    if type(desc) is not str or (conf is not None and type(conf) is not str):
+        return None
+    if type(srcs) is not list or any(type(src) is not str for src in srcs):
+        return None
+    return desc, conf, tuple(srcs)
+
+
+def _semantic_errors_for_key(
+    desc: str, conf: Optional[str], srcs: Tuple[str, ...], fast_fail: bool
+) -> Tuple[str, ...]:
+    """Run _semantic_errors() on the fields of a well-typed key."""
+    parsed_yaml = {
+        "suggested_description": desc,
+        "confidence": conf,
+        "used_sources": list(srcs),
+    }
+    return tuple(_semantic_errors(parsed_yaml, fast_fail))
+
+
+@lru_cache(maxsize=_SEMANTIC_CACHE_MAXSIZE)
+def _semantic_errors_cached(
+    desc: str, conf: Optional[str], srcs: Tuple[str, ...], fast_fail: bool
+) -> Tuple[str, ...]:
+    """Memoized _semantic_errors_for_key()."""
+    return _semantic_errors_for_key(desc, conf, srcs, fast_fail)
+
+
+# Constant-time rules, shared by the fast_fail pre-pass and the full run so
+# both report the same messages.
+_BLANK_DESCRIPTION_ERROR = "suggested_description must be a non-empty string"
+
+
+def _confidence_error(conf: Any) -> Optional[str]:
+    """Return the confidence rule's error, or None."""
+    if conf not in CONFIDENCE_ALLOWED:
+        return "confidence must be one of: low, medium, high"
+    return None
+
+
+def _description_shape_error(desc: Any) -> Optional[str]:
+    """Return the description presence/length error, or None."""
     if not isinstance(desc, str) or desc.strip() == "":
-        errors.append("suggested_description must be a non-empty string")
-    else:
-        if len(desc) < 10:
-            errors.append("suggested_description is too short (min 10 chars)")
-        if len(desc) > 500:
-            errors.append("suggested_description is too long (max 500 chars)")
+        return _BLANK_DESCRIPTION_ERROR
+    if len(desc) < 10:
+        return "suggested_description is too short (min 10 chars)"
+    if len(desc) > 500:
+        return "suggested_description is too long (max 500 chars)"
+    return None
+
+
+def _sources_shape_error(srcs: Any) -> Optional[str]:
+    """Return the used_sources array error, or None."""
+    if not isinstance(srcs, list) or len(srcs) == 0:
+        return "used_sources must be a non-empty array"
+    return None
+
+
+def _source_item_error(idx: int, src: Any) -> Optional[str]:
+    """Return the error for one used_sources entry's type, or None."""
+    if not isinstance(src, str) or src.strip() == "":
+        return f"used_sources[{idx}] must be a non-empty string"
+    return None
+
+
+def _first_cheap_error(parsed_yaml: Dict[str, Any]) -> Optional[str]:
+    """Return the first failing constant-time rule, or None."""
+    error = _confidence_error(parsed_yaml.get("confidence"))
+    if error is None:
+        error = _description_shape_error(parsed_yaml.get("suggested_description", ""))
+    if error is None:
+        srcs = parsed_yaml.get("used_sources", [])
+        error = _sources_shape_error(srcs)
+        if error is None:
+            for idx, src in enumerate(srcs):
+                error = _source_item_error(idx, src)
+                if error is not None:
+                    break
+    return error
+
+
+def _semantic_errors(parsed_yaml: Dict[str, Any], fast_fail: bool) -> List[str]:
+    """Run the semantic rules and return their error messages in order."""
+    if fast_fail:
+        # Cheapest first: decide on set lookups and lengths before scanning
+        error = _first_cheap_error(parsed_yaml)
+        if error is not None:
+            return [error]
+
+    errors: List[str] = []
+
+    desc = parsed_yaml.get("suggested_description", "")
+    shape_error = _description_shape_error(desc)
+    if shape_error is not None:
+        errors.append(shape_error)
+    if shape_error != _BLANK_DESCRIPTION_ERROR:
+        # Lowercase once for the ASCII prefilter and token rules
+        low = desc.lower() if desc.isascii() else None
         # Generic phrases
-        for pat in GENERIC_PATTERNS:
-            if re.search(pat, desc, flags=re.IGNORECASE):
-                errors.append("suggested_description is trivially generic")
-                break
+        if _may_contain(low, _GENERIC_LITERALS) and _GENERIC_RE.search(desc):
+            errors.append("suggested_description is trivially generic")
+        hits = _description_rule_hits(desc, low)
         # Forbidden concepts
-        for pat in FORBIDDEN_PHRASES:
-            if re.search(pat, desc, flags=re.IGNORECASE):
-                errors.append("suggested_description references forbidden concepts (LLM/prompt/system)")
-                break
+        if _FORBIDDEN_CONCEPT in hits:
+            errors.append("suggested_description references forbidden concepts (LLM/prompt/system)")
         # Speculative or disallowed language
-        for pat in FORBIDDEN_LANGUAGE:
-            if re.search(pat, desc, flags=re.IGNORECASE):
-                errors.append("suggested_description uses speculative or disallowed phrasing (forbidden concepts)")
-                break
+        if _FORBIDDEN_LANGUAGE in hits:
+            errors.append("suggested_description uses speculative or disallowed phrasing (forbidden concepts)")
 
-    conf = parsed_yaml.get("confidence")
-    if conf not in CONFIDENCE_ALLOWED:
-        errors.append("confidence must be one of: low, medium, high")
+    if fast_fail and errors:
+        return errors
+
+    conf_error = _confidence_error(parsed_yaml.get("confidence"))
+    if conf_error is not None:
+        errors.append(conf_error)
+        if fast_fail:
+            return errors
 
     srcs = parsed_yaml.get("used_sources", [])
-    if not isinstance(srcs, list) or len(srcs) == 0:
-        errors.append("used_sources must be a non-empty array")
+    sources_error = _sources_shape_error(srcs)
+    if sources_error is not None:
+        errors.append(sources_error)
     else:
         for idx, s in enumerate(srcs):
-            if not isinstance(s, str) or s.strip() == "":
-                errors.append(f"used_sources[{idx}] must be a non-empty string")
-                continue
+            error = _source_item_error(idx, s)
             # Disallow generic or non-RAG identifiers
-            if re.search(r"general knowledge|training data|internet|wikipedia", s, flags=re.IGNORECASE):
-                errors.append(f"used_sources[{idx}] references forbidden source identifiers")
+            if error is None and _FORBIDDEN_SOURCE_RE.search(s):
+                error = f"used_sources[{idx}] references forbidden source identifiers"
+            if error is None:
+                continue
+            errors.append(error)
+            if fast_fail:
+                break
 
-    if errors:
-        return ValidationResult.invalid(semantic=errors)
-    return ValidationResult.valid()
+    return errors
@@ -1,6 +1,8 @@
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 
 from .result import ValidationResult
+from .yaml_subset import _parse_yaml_subset
 
 
 EXPECTED_ORDER = [
@@ -18,94 +20,15 @@ REQUIRED_FIELDS = [
 
 OPTIONAL_FIELDS = ["warnings"]
 
+# Rank of each field in the contract order
+_ORDER_INDEX = {k: i for i, k in enumerate(EXPECTED_ORDER)}
 
-def _parse_yaml_subset(yaml_text: str) -> Tuple[Dict[str, Any], List[str]]:
-    """Parse a constrained YAML subset deterministically.
+# Membership views of the lists above; the lists keep their contract order
+_REQUIRED_FIELDS_SET = frozenset(REQUIRED_FIELDS)
+_ALLOWED_FIELDS_SET = _REQUIRED_FIELDS_SET | frozenset(OPTIONAL_FIELDS)
 
-    Supports:
-    - Top-level string fields: key: value (quoted or unquoted)
-    - Top-level arrays: key: followed by indented '- item' lines OR 'key: []'
-
-    Disallows:
-    - Comments ('# ...')
-    - Markdown or arbitrary preface text
-    - Nested objects
-
-    Returns: (parsed_dict, errors)
-    """
-    errors: List[str] = []
-    if yaml_text is None:
-        return {}, ["Input is None"]
-
-    lines = [ln.rstrip("\r\n") for ln in yaml_text.splitlines()]
-    # Remove empty lines
-    lines = [ln for ln in lines if ln.strip() != ""]
-
-    if any(ln.strip().startswith("#") for ln in lines):
-        errors.append("Comments are not allowed in YAML output")
-
-    # Track order and content
-    parsed: Dict[str, Any] = {}
-    seen_keys: List[str] = []
-    i = 0
-    n = len(lines)
-    while i < n:
-        ln = lines[i]
-        # Top-level key must start at column 0 and contain ':'
-        if ln.startswith(" ") or ":" not in ln:
-            errors.append(f"Unexpected line format: '{ln}'")
-            i += 1
-            continue
-
-        key, sep, rest = ln.partition(":")
-        key = key.strip()
-        value = rest.strip()
-
-        if key in parsed:
-            errors.append(f"Duplicate key '{key}'")
-
-        seen_keys.append(key)
-
-        # Array empty form: key: []
-        if value == "[]":
-            parsed[key] = []
-            i += 1
-            continue
-
-        # Array block form: key: \n  - item\n  - item
-        if value == "":
-            # Collect indented array items
-            items: List[str] = []
-            j = i + 1
-            while j < n:
-                nxt = lines[j]
-                stripped = nxt.lstrip()
-                if stripped.startswith("-") and not stripped.startswith("- "):
-                    # Disallow '-item' without space after '-'
-                    errors.append(f"Invalid array item format: '{nxt}'")
-                    j += 1
-                    continue
-                if stripped.startswith("- "):
-                    items.append(stripped[2:].strip())
-                    j += 1
-                    continue
-                # Not an array item; stop array collection
-                break
-            parsed[key] = items if items else None
-            i = j
-            continue
-
-        # String scalar value (quoted or unquoted)
-        scalar = value
-        # Strip surrounding quotes if present
-        if (scalar.startswith("\"") and scalar.endswith("\"")) or (
-            scalar.startswith("'") and scalar.endswith("'")
-        ):
-            scalar = scalar[1:-1]
-        parsed[key] = scalar
-        i += 1
-
-    return parsed, errors
+# Bound on memoized structural checks, keyed by the exact YAML text
+_STRUCTURAL_CACHE_MAXSIZE = 1024
 
 
 def validate_structural(yaml_text: str) -> ValidationResult:
@@ -118,7 +41,43 @@ def validate_structural(yaml_text: str) -> ValidationResult:
     - Field types (string/array)
     - Field ordering matches spec
     """
-    parsed, parse_errors = _parse_yaml_subset(yaml_text)
+    return _validate_structural(yaml_text)[0]
+
+
+def _validate_structural(yaml_text: str) -> Tuple[ValidationResult, Dict[str, Any]]:
+    """Run structural validation and also return the parsed dict.
+
+    Lets callers that go on to semantic validation reuse the single parse.
+
+    Results are memoized per YAML text; every call still gets its own
+    ValidationResult and parsed dict, so callers may mutate them freely.
+
+    Returns: (structural_result, parsed_dict)
+    """
+    if isinstance(yaml_text, str):
+        errors, parsed = _structural_check(yaml_text)
+    else:
+        errors, parsed = _structural_check_uncached(yaml_text)
+
+    # Copy the shared parse: values are strings or lists of strings
+    parsed = {k: list(v) if isinstance(v, list) else v for k, v in parsed.items()}
+    if errors:
+        return ValidationResult.invalid(structural=errors), parsed
+    return ValidationResult.valid(), parsed
+
+
+@lru_cache(maxsize=_STRUCTURAL_CACHE_MAXSIZE)
+def _structural_check(yaml_text: str) -> Tuple[Tuple[str, ...], Dict[str, Any]]:
+    """Memoized _structural_check_uncached().
+
+    The returned objects are shared by the cache and must not be mutated.
+    """
+    return _structural_check_uncached(yaml_text)
+
+
+def _structural_check_uncached(yaml_text: str) -> Tuple[Tuple[str, ...], Dict[str, Any]]:
+    """Parse and check *yaml_text*; returns (errors, parsed_dict)."""
+    parsed, parse_errors, seen_order = _parse_yaml_subset(yaml_text)
     errors: List[str] = []
 
     if parse_errors:
@@ -126,7 +85,7 @@ def validate_structural(yaml_text: str) -> ValidationResult:
 
     # Unknown fields
     for k in parsed.keys():
-        if k not in REQUIRED_FIELDS and k not in OPTIONAL_FIELDS:
+        if k not in _ALLOWED_FIELDS_SET:
             errors.append(f"Unknown field '{k}' not permitted by contract")
 
     # Required presence
@@ -158,30 +117,20 @@ def validate_structural(yaml_text: str) -> ValidationResult:
                 if not isinstance(item, str):
                     errors.append(f"warnings[{idx}] must be a string")
 
-    # Ordering: reconstruct order from original text lines
-    # Re-parse to get seen order without skipping unknown lines
-    lines = [ln.rstrip("\r\n") for ln in yaml_text.splitlines() if ln.strip() != ""]
-    seen_order: List[str] = []
-    for ln in lines:
-        if ln.startswith(" ") or ":" not in ln or ln.lstrip().startswith("- "):
-            # Only consider top-level keys
-            if ln.lstrip().startswith("- "):
-                continue
-            # Any non-key line is a violation of determinism
-            if not ln.lstrip().startswith("- ") and not ln.strip().startswith("#"):
-                # Non-YAML text before/after
-                errors.append(f"Unexpected non-key line: '{ln}'")
-            continue
-        key = ln.split(":", 1)[0].strip()
-        seen_order.append(key)
-
-    # Compare to expected order for keys present
-    expected_seq = [k for k in EXPECTED_ORDER if k in parsed]
-    if seen_order != expected_seq:
+    # Ordering: the parser records top-level keys in the order it saw them
+    # (non-key lines were already reported as parse errors); the sequence
+    # must be strictly increasing in rank; unknown or repeated keys break it
+    in_order = True
+    prev = -1
+    for k in seen_order:
+        idx = _ORDER_INDEX.get(k, -1)
+        if idx <= prev:
+            in_order = False
+            break
+        prev = idx
+    if not in_order:
         errors.append(
             "Field order must be: suggested_description, confidence, used_sources, warnings"
         )
 
-    if errors:
-        return ValidationResult.invalid(structural=errors)
-    return ValidationResult.valid()
+    return tuple(errors), parsed
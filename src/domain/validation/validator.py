@@ -1,25 +1,40 @@
-from typing import Tuple, Dict, Any
+from typing import Any, Dict, Tuple
 
 from .result import ValidationResult
-from .structural_validator import validate_structural, _parse_yaml_subset
+from .structural_validator import _validate_structural
 from .semantic_validator import validate_semantic
 
 
-def validate_output(yaml_text: str) -> Tuple[ValidationResult, ValidationResult]:
+def validate_output(
+    yaml_text: str, fast_fail: bool = False
+) -> Tuple[ValidationResult, ValidationResult]:
     """Run two-layer validation on the given YAML text.
 
     Returns a tuple: (structural_result, semantic_result).
     Semantic validation runs only if structural validation passes; otherwise,
     semantic_result will be a valid() placeholder with no errors.
+
+    fast_fail is passed through to validate_semantic for callers that only
+    need is_valid; callers that report errors keep the default.
     """
-    structural = validate_structural(yaml_text)
-    if not structural.is_valid:
-        return structural, ValidationResult.valid()
+    structural, semantic, _ = _validate_output(yaml_text, fast_fail)
+    return structural, semantic
 
-    parsed, parse_errors = _parse_yaml_subset(yaml_text)
-    # Structural should have caught parse errors; be defensive
-    if parse_errors:
-        return ValidationResult.invalid(structural=parse_errors), ValidationResult.valid()
 
-    semantic = validate_semantic(parsed)
-    return structural, semantic
+def _validate_output(
+    yaml_text: str, fast_fail: bool = False
+) -> Tuple[ValidationResult, ValidationResult, Dict[str, Any]]:
+    """Run two-layer validation and also return the parsed dict.
+
+    Lets callers that apply further rules to the output (e.g. the runtime
+    validator) reuse the single parse instead of parsing the text again.
+
+    Returns: (structural_result, semantic_result, parsed_dict)
+    """
+    # Parse once; structural validation hands back the dict it validated
+    structural, parsed = _validate_structural(yaml_text)
+    if not structural.is_valid:
+        return structural, ValidationResult.valid(), parsed
+
+    semantic = validate_semantic(parsed, fast_fail=fast_fail)
+    return structural, semantic, parsed
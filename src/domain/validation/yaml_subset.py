@@ -0,0 +1,110 @@
+"""Constrained YAML subset parser for LLM output validation.
+
+Kept in its own fully annotated, dependency-free module so it can be
+compiled ahead of time with mypyc (``mypyc src/domain/validation/yaml_subset.py``)
+without touching the validators. A compiled build produces an extension
+module with the same import name that takes precedence over this file, so
+no import fallback is needed: when no compiled build is present, this
+pure-Python implementation is used.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _parse_yaml_subset(
+    yaml_text: Optional[str],
+) -> Tuple[Dict[str, Any], List[str], List[str]]:
+    """Parse a constrained YAML subset deterministically.
+
+    Supports:
+    - Top-level string fields: key: value (quoted or unquoted)
+    - Top-level arrays: key: followed by indented '- item' lines OR 'key: []'
+
+    Disallows:
+    - Comments ('# ...')
+    - Markdown or arbitrary preface text
+    - Nested objects
+
+    Returns: (parsed_dict, errors, seen_keys), where seen_keys lists the
+    top-level keys in the order they appear in the text.
+    """
+    errors: List[str] = []
+    if yaml_text is None:
+        return {}, ["Input is None"], []
+
+    # Single pre-pass: drop empty lines and detect comments
+    lines: List[str] = []
+    has_comment: bool = False
+    for raw in yaml_text.splitlines():
+        ln = raw.rstrip("\r\n")
+        stripped_ln = ln.strip()
+        if not stripped_ln:
+            continue
+        if stripped_ln[0] == "#":
+            has_comment = True
+        lines.append(ln)
+
+    if has_comment:
+        errors.append("Comments are not allowed in YAML output")
+
+    # Track order and content
+    parsed: Dict[str, Any] = {}
+    seen_keys: List[str] = []
+    i: int = 0
+    n: int = len(lines)
+    while i < n:
+        ln = lines[i]
+        # Top-level key must start at column 0 and contain ':'
+        if ln.startswith(" ") or ":" not in ln:
+            errors.append(f"Unexpected line format: '{ln}'")
+            i += 1
+            continue
+
+        key, sep, rest = ln.partition(":")
+        key = key.strip()
+        value = rest.strip()
+
+        if key in parsed:
+            errors.append(f"Duplicate key '{key}'")
+
+        seen_keys.append(key)
+
+        # Array empty form: key: []
+        if value == "[]":
+            parsed[key] = []
+            i += 1
+            continue
+
+        # Array block form: key: \n  - item\n  - item
+        if value == "":
+            # Collect indented array items
+            items: List[str] = []
+            j: int = i + 1
+            while j < n:
+                nxt = lines[j]
+                stripped = nxt.lstrip()
+                if stripped.startswith("-") and not stripped.startswith("- "):
+                    # Disallow '-item' without space after '-'
+                    errors.append(f"Invalid array item format: '{nxt}'")
+                    j += 1
+                    continue
+                if stripped.startswith("- "):
+                    items.append(stripped[2:].strip())
+                    j += 1
+                    continue
+                # Not an array item; stop array collection
+                break
+            parsed[key] = items if items else None
+            i = j
+            continue
+
+        # String scalar value (quoted or unquoted)
+        scalar = value
+        # Strip surrounding quotes if present
+        if (scalar.startswith("\"") and scalar.endswith("\"")) or (
+            scalar.startswith("'") and scalar.endswith("'")
+        ):
+            scalar = scalar[1:-1]
+        parsed[key] = scalar
+        i += 1
+
+    return parsed, errors, seen_keys
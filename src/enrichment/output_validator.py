@@ -41,8 +41,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from src.domain.validation.validator import validate_output
-from src.domain.validation.structural_validator import _parse_yaml_subset
+from src.domain.validation.validator import _validate_output
 from src.domain.validation.result import ValidationResult
 
 logger = logging.getLogger("enrichment.output_validator")
@@ -294,7 +293,9 @@ def validate_llm_output(
     # ------------------------------------------------------------------
     # Phase 1: Blocking validation (existing Validation Engine)
     # ------------------------------------------------------------------
-    structural_result, semantic_result = validate_output(normalized)
+    # The engine parses the output once; the parsed dict is reused by the
+    # V040 and advisory rules below.
+    structural_result, semantic_result, parsed = _validate_output(normalized)
 
     blocking_errors: List[str] = []
     blocking_errors.extend(structural_result.structural_errors)
@@ -340,8 +341,7 @@ def validate_llm_output(
     # output, which is the correct behaviour: blocked outputs do not
     # generate advisory flags (enforced by RuntimeValidationResult).
     # ------------------------------------------------------------------
-    parsed_phase1, _ = _parse_yaml_subset(normalized)
-    if parsed_phase1.get("confidence") == "low":
+    if parsed.get("confidence") == "low":
         v040_error = (
             "V040: LLM output confidence is 'low' — output is insufficiently "
             "grounded in retrieved context and is blocked from Purview writeback."
@@ -372,7 +372,6 @@ def validate_llm_output(
     # ------------------------------------------------------------------
     # Phase 2: Advisory rules (only if blocking rules all passed)
     # ------------------------------------------------------------------
-    parsed, _ = _parse_yaml_subset(normalized)
     advisory_flags, advisory_rule_ids = _evaluate_advisory_rules(parsed)
     rules_executed.extend(advisory_rule_ids)
 
@@ -8,6 +8,8 @@ Validates:
 - Invalid or incomplete previous state → REPROCESS
 """
 
+from collections import OrderedDict
+
 import pytest
 
 from src.domain.change_detection import (
@@ -16,65 +18,70 @@ from src.domain.change_detection import (
 )
 
 
-class TestDecision:
-    def test_new_asset_no_previous_state(self):
-        assert (
-            decide_reprocess_or_skip("abc123", None) == DecisionResult.REPROCESS
-        )
-
-    def test_unchanged_asset_same_hash(self):
-        current = "deadbeef" * 8  # 64 chars
-        previous = current
-        assert decide_reprocess_or_skip(current, previous) == DecisionResult.SKIP
-
-    def test_changed_asset_different_hash(self):
-        current = "0" * 64
-        previous = "1" * 64
-        assert (
-            decide_reprocess_or_skip(current, previous) == DecisionResult.REPROCESS
-        )
-
-    def test_previous_state_object_with_hash_key(self):
-        current = "a" * 64
-        previous_obj = {"hash": current}
-        assert decide_reprocess_or_skip(current, previous_obj) == DecisionResult.SKIP
-
-    def test_previous_state_object_with_previous_hash_key(self):
-        current = "b" * 64
-        previous_obj = {"previousHash": current}
-        assert decide_reprocess_or_skip(current, previous_obj) == DecisionResult.SKIP
-
-    def test_invalid_previous_state_missing_hash(self):
-        current = "c" * 64
-        previous_obj = {}
-        assert (
-            decide_reprocess_or_skip(current, previous_obj)
-            == DecisionResult.REPROCESS
-        )
+# 64-char hex hashes shared by all cases
+_H0, _H1, _HA, _HB, _HC, _HD, _HE, _HF = (
+    c * 64 for c in "01abcdef"
+)
+_DEADBEEF = "deadbeef" * 8
+_DEADBEEF_DIGEST = bytes.fromhex(_DEADBEEF)
 
-    def test_invalid_previous_state_non_string_hash(self):
-        current = "d" * 64
-        previous_obj = {"hash": 12345}
-        assert (
-            decide_reprocess_or_skip(current, previous_obj)
-            == DecisionResult.REPROCESS
-        )
+_CASES = [
+    # (id, current_hash, previous_state, expected)
+    ("new_asset_no_previous_state", "abc123", None, DecisionResult.REPROCESS),
+    ("unchanged_asset_same_hash", _DEADBEEF, _DEADBEEF, DecisionResult.SKIP),
+    ("changed_asset_different_hash", _H0, _H1, DecisionResult.REPROCESS),
+    ("previous_state_object_with_hash_key", _HA, {"hash": _HA}, DecisionResult.SKIP),
+    (
+        "previous_state_object_with_previous_hash_key",
+        _HB,
+        {"previousHash": _HB},
+        DecisionResult.SKIP,
+    ),
+    ("invalid_previous_state_missing_hash", _HC, {}, DecisionResult.REPROCESS),
+    (
+        "invalid_previous_state_non_string_hash",
+        _HD,
+        {"hash": 12345},
+        DecisionResult.REPROCESS,
+    ),
+    (
+        "invalid_previous_state_empty_string_hash",
+        _HE,
+        {"hash": ""},
+        DecisionResult.REPROCESS,
+    ),
+    (
+        "unsupported_previous_state_type_defaults_reprocess",
+        _HF,
+        ["not supported"],
+        DecisionResult.REPROCESS,
+    ),
+    (
+        "previous_state_dict_subclass_with_hash_key",
+        _HA,
+        OrderedDict(hash=_HA),
+        DecisionResult.SKIP,
+    ),
+    ("digest_current_hex_previous", _DEADBEEF_DIGEST, _DEADBEEF, DecisionResult.SKIP),
+    ("hex_current_digest_previous", _DEADBEEF, _DEADBEEF_DIGEST, DecisionResult.SKIP),
+    ("digest_current_and_previous", _DEADBEEF_DIGEST, _DEADBEEF_DIGEST, DecisionResult.SKIP),
+    (
+        "digest_changed_asset",
+        bytes.fromhex(_H0),
+        bytes.fromhex(_H1),
+        DecisionResult.REPROCESS,
+    ),
+    ("empty_previous_digest", _DEADBEEF_DIGEST, b"", DecisionResult.REPROCESS),
+]
 
-    def test_invalid_previous_state_empty_string_hash(self):
-        current = "e" * 64
-        previous_obj = {"hash": ""}
-        assert (
-            decide_reprocess_or_skip(current, previous_obj)
-            == DecisionResult.REPROCESS
-        )
 
-    def test_unsupported_previous_state_type_defaults_reprocess(self):
-        current = "f" * 64
-        previous_state = ["not supported"]
-        assert (
-            decide_reprocess_or_skip(current, previous_state)
-            == DecisionResult.REPROCESS
-        )
+class TestDecision:
+    @pytest.mark.parametrize(
+        "current, previous_state, expected",
+        [pytest.param(*case[1:], id=case[0]) for case in _CASES],
+    )
+    def test_decision(self, current, previous_state, expected):
+        assert decide_reprocess_or_skip(current, previous_state) == expected
 
     def test_type_error_on_non_string_current_hash(self):
         with pytest.raises(TypeError):
@@ -8,15 +8,53 @@ Tests verify:
 - Normalization handles edge cases correctly
 """
 
+import hashlib
+import re
+import tracemalloc
+from types import MappingProxyType
+from unittest.mock import patch
+
 import pytest
+from src.domain.change_detection import hasher
 from src.domain.change_detection import (
     compute_asset_hash,
+    compute_asset_hashes,
+    compute_asset_hash_cached,
+    clear_hash_cache,
     are_assets_equal_by_hash,
     normalize_asset,
     get_asset_hash_components,
+    get_material_fields,
+    get_volatile_fields,
+    AssetMetadata,
+    NormalizedAsset,
+)
+
+
+# A SHA-256 digest rendered as 64 lowercase hex characters
+_HEX64 = re.compile(r"[0-9a-f]{64}").fullmatch
+
+# Shared prototype for test assets; tests derive variants via _asset(**overrides)
+_BASE = MappingProxyType(
+    {
+        "id": "test.table",
+        "sourceSystem": "synergy",
+        "entityType": "table",
+        "elementName": "Test",
+        "entityPath": "path",
+        "description": "Test",
+        "businessMeaning": "Test",
+        "domain": "Test",
+        "content": "Test",
+    }
 )
 
 
+def _asset(**overrides):
+    """Return a fresh asset dict: the shared prototype plus overrides."""
+    return {**_BASE, **overrides}
+
+
 class TestNormalization:
     """Tests for asset normalization."""
 
@@ -105,6 +143,37 @@ class TestNormalization:
 
         assert normalized["tags"] == ["analytics", "customer", "sales"]
 
+    def test_normalize_orders_case_variants_deterministically(self):
+        """Tags differing only in case should sort by exact value as tie-break."""
+        forward = normalize_asset({"id": "t", "tags": ["sales", "Sales", "b", "SALES"]})
+        backward = normalize_asset({"id": "t", "tags": ["SALES", "b", "Sales", "sales"]})
+        canonical = normalize_asset({"id": "t", "tags": ["b", "SALES", "Sales", "sales"]})
+
+        assert forward["tags"] == ["b", "SALES", "Sales", "sales"]
+        assert backward["tags"] == forward["tags"]
+        assert canonical["tags"] == forward["tags"]
+
+    def test_normalize_already_sorted_tags_returns_copy(self):
+        """Already-canonical tags should be returned unchanged, as a new list."""
+        tags = ["analytics", "Customer", "sales"]
+        asset = {
+            "id": "test.table",
+            "sourceSystem": "synergy",
+            "entityType": "table",
+            "elementName": "Test",
+            "entityPath": "path",
+            "description": "Test",
+            "businessMeaning": "Test",
+            "domain": "Test",
+            "content": "Test",
+            "tags": tags,
+        }
+
+        normalized = normalize_asset(asset)
+
+        assert normalized["tags"] == ["analytics", "Customer", "sales"]
+        assert normalized["tags"] is not tags
+
     def test_normalize_sorts_relationships_by_id(self):
         """Relationships should be sorted by id."""
         asset = {
@@ -240,264 +309,194 @@ class TestHashing:
         assert hash1 == hash2
         assert len(hash1) == 64  # SHA-256 is 64 hex characters
 
-    def test_reordered_tags_produce_same_hash(self):
-        """Different tag ordering should not affect the hash."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "tags": ["analytics", "customer", "sales"],
-        }
+    @pytest.mark.parametrize(
+        "field, val_a, val_b, should_match",
+        [
+            pytest.param(
+                "tags",
+                ["analytics", "customer", "sales"],
+                ["sales", "analytics", "customer"],
+                True,
+                id="reordered_tags_same_hash",
+            ),
+            pytest.param(
+                "lastUpdated",
+                "2026-01-20T10:00:00Z",
+                "2026-01-24T14:00:00Z",
+                True,
+                id="different_timestamp_same_hash",
+            ),
+            pytest.param(
+                "scanId",
+                "scan-2026-01-20-abc",
+                "scan-2026-01-24-def",
+                True,
+                id="different_scan_id_same_hash",
+            ),
+            pytest.param(
+                "description",
+                "Contains customer information",
+                "Contains customer information and purchase history",
+                False,
+                id="description_change_different_hash",
+            ),
+            pytest.param(
+                "businessMeaning",
+                "Sales records only",
+                "Sales and inventory records",
+                False,
+                id="business_meaning_change_different_hash",
+            ),
+            pytest.param(
+                "content",
+                "Original content for semantic indexing",
+                "Updated content with additional information",
+                False,
+                id="content_change_different_hash",
+            ),
+            pytest.param(
+                "tags",
+                ["sales", "customer"],
+                ["sales", "customer", "analytics"],
+                False,
+                id="new_tag_different_hash",
+            ),
+            pytest.param(
+                "id",
+                "test.table",
+                "test.table.v2",
+                False,
+                id="entity_id_change_different_hash",
+            ),
+        ],
+    )
+    def test_hash_field_sensitivity(self, field, val_a, val_b, should_match):
+        """Material fields change the hash; ordering and volatile fields do not."""
+        hash_a = compute_asset_hash(_asset(**{field: val_a}))
+        hash_b = compute_asset_hash(_asset(**{field: val_b}))
+
+        assert (hash_a == hash_b) is should_match
 
-        asset2 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "tags": ["sales", "analytics", "customer"],
-        }
-
-        hash1 = compute_asset_hash(asset1)
-        hash2 = compute_asset_hash(asset2)
-
-        assert hash1 == hash2
+    def test_hash_is_lowercase_hex(self):
+        """Hash should be lowercase hexadecimal."""
+        asset = _asset()
 
-    def test_different_timestamp_produces_same_hash(self):
-        """Different lastUpdated timestamps should not affect the hash."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "lastUpdated": "2026-01-20T10:00:00Z",
-        }
+        hash_value = compute_asset_hash(asset)
 
-        asset2 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "lastUpdated": "2026-01-24T14:00:00Z",
-        }
+        assert _HEX64(hash_value)
 
-        hash1 = compute_asset_hash(asset1)
-        hash2 = compute_asset_hash(asset2)
+    def test_are_assets_equal_by_hash_true(self):
+        """are_assets_equal_by_hash should return True for identical assets."""
+        asset1 = _asset()
 
-        assert hash1 == hash2
+        asset2 = _asset()
 
-    def test_different_scan_id_produces_same_hash(self):
-        """Different scanIds should not affect the hash."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "scanId": "scan-2026-01-20-abc",
-        }
+        assert are_assets_equal_by_hash(asset1, asset2)
 
-        asset2 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "scanId": "scan-2026-01-24-def",
-        }
+    def test_are_assets_equal_by_hash_false(self):
+        """are_assets_equal_by_hash should return False for different assets."""
+        asset1 = _asset()
 
-        hash1 = compute_asset_hash(asset1)
-        hash2 = compute_asset_hash(asset2)
+        asset2 = _asset(description="Test Updated")
 
-        assert hash1 == hash2
+        assert not are_assets_equal_by_hash(asset1, asset2)
 
-    def test_material_content_change_produces_different_hash(self):
-        """A change in material content should produce a different hash."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Customer Data",
-            "entityPath": "db.schema.customer",
-            "description": "Contains customer information",
-            "businessMeaning": "Primary customer records",
-            "domain": "CRM",
-            "content": "Customer table with name, email, phone",
-        }
+    def test_are_assets_equal_by_hash_ignores_volatile_fields(self):
+        """are_assets_equal_by_hash should ignore volatile fields."""
+        asset1 = _asset(lastUpdated="2026-01-20T10:00:00Z")
 
-        asset2 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Customer Data",
-            "entityPath": "db.schema.customer",
-            "description": "Contains customer information and purchase history",  # Changed
-            "businessMeaning": "Primary customer records",
-            "domain": "CRM",
-            "content": "Customer table with name, email, phone",
-        }
+        asset2 = _asset(lastUpdated="2026-01-24T14:00:00Z")
 
-        hash1 = compute_asset_hash(asset1)
-        hash2 = compute_asset_hash(asset2)
+        assert are_assets_equal_by_hash(asset1, asset2)
 
-        assert hash1 != hash2
+    def test_are_assets_equal_by_hash_shortcircuits_on_id_mismatch(self):
+        """Different ids should be decided without serializing either asset."""
+        with patch.object(hasher, "_to_canonical_json") as mock_serialize:
+            assert not are_assets_equal_by_hash(_asset(), _asset(id="other.table"))
+            mock_serialize.assert_not_called()
+
+    def test_are_assets_equal_by_hash_shortcircuits_on_identity(self):
+        """The same object should compare equal after one normalization."""
+        asset = _asset()
+        with patch.object(hasher, "normalize_asset", wraps=normalize_asset) as mock_normalize:
+            assert are_assets_equal_by_hash(asset, asset)
+            mock_normalize.assert_called_once_with(asset)
+
+    @pytest.mark.parametrize("other_id", [None, "other.table"], ids=["same-object", "id-mismatch"])
+    def test_are_assets_equal_by_hash_validates_before_shortcuts(self, other_id):
+        """Malformed assets should raise even when a shortcut would apply."""
+        bad = _asset(tags="x")
+        other = bad if other_id is None else _asset(id=other_id)
 
-    def test_business_meaning_change_produces_different_hash(self):
-        """A change in businessMeaning should produce a different hash."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Sales records only",
-            "domain": "Test",
-            "content": "Test",
-        }
+        with pytest.raises(TypeError):
+            are_assets_equal_by_hash(bad, other)
+        with pytest.raises(TypeError):
+            are_assets_equal_by_hash(other, bad)
 
-        asset2 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Sales and inventory records",
-            "domain": "Test",
-            "content": "Test",
-        }
+    def test_are_assets_equal_by_hash_compares_canonical_form(self):
+        """Reordered collections are equal; differing content is not."""
+        asset1 = _asset(tags=["b", "a"])
+        asset2 = _asset(tags=["a", "b"])
 
-        hash1 = compute_asset_hash(asset1)
-        hash2 = compute_asset_hash(asset2)
+        assert are_assets_equal_by_hash(asset1, asset2)
+        assert not are_assets_equal_by_hash(asset1, _asset(tags=["a", "c"]))
 
-        assert hash1 != hash2
+    @pytest.mark.parametrize("value1, value2", [(1, 1.0), (1, True), (0, False)])
+    def test_are_assets_equal_by_hash_agrees_with_hash_on_equal_scalars(self, value1, value2):
+        """Values that compare == but serialize differently are not equal."""
+        asset1 = _asset(content=value1)
+        asset2 = _asset(content=value2)
 
-    def test_content_change_produces_different_hash(self):
-        """A change in the content field should produce a different hash."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Original content for semantic indexing",
-        }
+        assert compute_asset_hash(asset1) != compute_asset_hash(asset2)
+        assert not are_assets_equal_by_hash(asset1, asset2)
 
-        asset2 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Updated content with additional information",
-        }
+    def test_are_assets_equal_by_hash_large_assets(self):
+        """Large assets are compared through the streaming hash."""
+        asset1 = _asset(content="x" * hasher._STREAMING_THRESHOLD)
+        asset2 = _asset(content="x" * hasher._STREAMING_THRESHOLD)
 
-        hash1 = compute_asset_hash(asset1)
-        hash2 = compute_asset_hash(asset2)
+        assert are_assets_equal_by_hash(asset1, asset2)
+        assert not are_assets_equal_by_hash(asset1, _asset(content="y" * hasher._STREAMING_THRESHOLD))
 
-        assert hash1 != hash2
+    def test_are_assets_equal_by_hash_empty_id_differs_from_missing_id(self):
+        """An empty id is kept by normalization, so it is not the same as no id."""
+        with_empty_id = _asset(id="")
+        without_id = _asset()
+        del without_id["id"]
 
-    def test_new_tag_produces_different_hash(self):
-        """Adding a new tag should produce a different hash."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "tags": ["sales", "customer"],
-        }
+        assert not are_assets_equal_by_hash(with_empty_id, without_id)
+        assert compute_asset_hash(with_empty_id) != compute_asset_hash(without_id)
 
-        asset2 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "tags": ["sales", "customer", "analytics"],
-        }
+    def test_are_assets_equal_by_hash_error_on_non_dict(self):
+        """Type errors should be raised even for identical arguments."""
+        with pytest.raises(TypeError):
+            are_assets_equal_by_hash("not a dict", "not a dict")
 
-        hash1 = compute_asset_hash(asset1)
-        hash2 = compute_asset_hash(asset2)
 
-        assert hash1 != hash2
+class TestStreamingHashing:
+    """Tests for streamed hashing of large assets."""
 
-    def test_entity_id_change_produces_different_hash(self):
-        """Changing the entity id should produce a different hash."""
-        asset1 = {
+    def test_large_asset_hash_matches_one_shot_canonical_json(self):
+        """Streaming must hash exactly the canonical JSON bytes."""
+        asset = {
             "id": "test.table",
             "sourceSystem": "synergy",
             "entityType": "table",
             "elementName": "Test",
             "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-        }
-
-        asset2 = {
-            "id": "test.table.v2",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
+            "description": "Ünïcödé description",
             "businessMeaning": "Test",
             "domain": "Test",
-            "content": "Test",
+            "content": "x" * (hasher._STREAMING_THRESHOLD + 1),
+            "tags": ["b", "a"],
+            "columns": [{"name": "c2", "type": "int"}, {"name": "c1", "type": "str"}],
         }
+        canonical = hasher._to_canonical_json(normalize_asset(asset))
 
-        hash1 = compute_asset_hash(asset1)
-        hash2 = compute_asset_hash(asset2)
-
-        assert hash1 != hash2
+        assert compute_asset_hash(asset) == hashlib.sha256(canonical).hexdigest()
 
-    def test_hash_is_lowercase_hex(self):
-        """Hash should be lowercase hexadecimal."""
+    def test_streaming_matches_one_shot_for_small_asset(self):
+        """Forcing the streaming path should not change the hash."""
         asset = {
             "id": "test.table",
             "sourceSystem": "synergy",
@@ -508,98 +507,240 @@ class TestHashing:
             "businessMeaning": "Test",
             "domain": "Test",
             "content": "Test",
+            "relationships": [{"id": "rel.b"}, {"id": "rel.a"}],
         }
+        expected = compute_asset_hash(asset)
 
-        hash_value = compute_asset_hash(asset)
+        with patch.object(hasher, "_STREAMING_THRESHOLD", 0):
+            assert compute_asset_hash(asset) == expected
 
-        assert len(hash_value) == 64
-        assert all(c in "0123456789abcdef" for c in hash_value)
-
-    def test_are_assets_equal_by_hash_true(self):
-        """are_assets_equal_by_hash should return True for identical assets."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-        }
-
-        asset2 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-        }
+    def test_streaming_splits_nested_values(self):
+        """Slicing strings and walking nested collections keeps the bytes."""
+        asset = _asset(
+            description='Quote " backslash \\ newline \n control \x01 é € 😀 ' * 3,
+            tags=["b", "a", "Ä"],
+            columns=[
+                {"name": "c2", "type": "int", "meta": {"nullable": True, "scale": 1.5e16}},
+                {"name": "c1", "type": "str", "meta": {"values": ["x", None, 3]}},
+            ],
+        )
+        canonical = hasher._to_canonical_json(normalize_asset(asset))
+
+        for piece_size in (1, 2, 5, 16):
+            with patch.object(hasher, "_STREAMING_THRESHOLD", 0), patch.object(
+                hasher, "_STREAM_PIECE_SIZE", piece_size
+            ):
+                assert compute_asset_hash(asset) == hashlib.sha256(canonical).hexdigest()
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"content": "x" * (8 * 1024 * 1024)},
+            {"columns": [{"name": f"c{i:05d}", "description": "d" * 5000} for i in range(1600)]},
+        ],
+        ids=["large-content", "large-columns"],
+    )
+    def test_streaming_does_not_materialize_large_values(self, overrides):
+        """Peak memory while hashing should not grow with the asset size."""
+        asset = _asset(**overrides)
+        expected = hashlib.sha256(hasher._to_canonical_json(normalize_asset(asset))).hexdigest()
+
+        tracemalloc.start()
+        try:
+            assert compute_asset_hash(asset) == expected
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 1024 * 1024
+
+    def test_streaming_check_does_not_walk_short_collections(self):
+        """Ordinary assets should be sized from their top-level values only."""
+        asset = _asset(columns=[{"name": f"c{i}", "type": "int"} for i in range(12)])
+        expected = hashlib.sha256(hasher._to_canonical_json(normalize_asset(asset))).hexdigest()
+
+        with patch.object(hasher, "_estimate_canonical_size", side_effect=AssertionError):
+            assert compute_asset_hash(asset) == expected
+            assert are_assets_equal_by_hash(asset, dict(asset))
+
+    def test_streaming_rejects_circular_references(self):
+        """Circular values should fail like the one-shot encoder does."""
+        column = {"name": "c1", "description": "d" * hasher._STREAMING_THRESHOLD}
+        column["self"] = [column]
+
+        with pytest.raises(ValueError, match="Circular reference"):
+            compute_asset_hash(_asset(columns=[column]))
+
+
+class TestBatchHashing:
+    """Tests for batch hashing."""
+
+    def test_batch_matches_single_asset_hashes(self):
+        """Each batch hash should equal the single-asset hash, in order."""
+        assets = [
+            {
+                "id": "test.table.a",
+                "sourceSystem": "synergy",
+                "entityType": "table",
+                "elementName": "Test A",
+                "entityPath": "path.a",
+                "description": "Test A",
+                "businessMeaning": "Test",
+                "domain": "Test",
+                "content": "Test",
+                "tags": ["sales", "customer"],
+            },
+            {
+                "id": "test.table.b",
+                "sourceSystem": "zipline",
+                "entityType": "dataset",
+                "elementName": "Test B",
+                "entityPath": "path.b",
+                "description": "Test B",
+                "businessMeaning": "Test",
+                "domain": "Test",
+                "content": "Test",
+            },
+        ]
+
+        hashes = compute_asset_hashes(assets)
+
+        assert hashes == [compute_asset_hash(a) for a in assets]
+        assert hashes[0] != hashes[1]
+
+    def test_batch_empty_list(self):
+        """An empty batch should produce an empty list."""
+        assert compute_asset_hashes([]) == []
+
+    def test_batch_error_on_non_list(self):
+        """Should raise TypeError if assets is not a list."""
+        with pytest.raises(TypeError):
+            compute_asset_hashes({"id": "test.table"})
 
-        assert are_assets_equal_by_hash(asset1, asset2)
+    def test_batch_error_on_non_dict_item(self):
+        """Should raise TypeError if any asset is not a dictionary."""
+        with pytest.raises(TypeError):
+            compute_asset_hashes([{"id": "test.table"}, "not an asset"])
 
-    def test_are_assets_equal_by_hash_false(self):
-        """are_assets_equal_by_hash should return False for different assets."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-        }
 
-        asset2 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test Updated",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-        }
+class TestCachedHashing:
+    """Tests for caller-keyed hash memoization."""
 
-        assert not are_assets_equal_by_hash(asset1, asset2)
+    def setup_method(self):
+        clear_hash_cache()
 
-    def test_are_assets_equal_by_hash_ignores_volatile_fields(self):
-        """are_assets_equal_by_hash should ignore volatile fields."""
-        asset1 = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "lastUpdated": "2026-01-20T10:00:00Z",
-        }
+    def teardown_method(self):
+        clear_hash_cache()
 
-        asset2 = {
+    def _asset(self, description="Test"):
+        return {
             "id": "test.table",
             "sourceSystem": "synergy",
             "entityType": "table",
             "elementName": "Test",
             "entityPath": "path",
-            "description": "Test",
+            "description": description,
             "businessMeaning": "Test",
             "domain": "Test",
             "content": "Test",
-            "lastUpdated": "2026-01-24T14:00:00Z",
+            "lastUpdated": "2026-01-24T10:00:00Z",
         }
 
-        assert are_assets_equal_by_hash(asset1, asset2)
+    def test_cached_hash_matches_uncached(self):
+        """A cache miss should return the same hash as compute_asset_hash."""
+        asset = self._asset()
+        key = (asset["id"], asset["lastUpdated"])
+
+        assert compute_asset_hash_cached(asset, key) == compute_asset_hash(asset)
+
+    def test_cache_hit_skips_recomputation(self):
+        """A second call with the same key should be served from the cache."""
+        asset = self._asset()
+        key = (asset["id"], asset["lastUpdated"])
+        first = compute_asset_hash_cached(asset, key)
+
+        # Same key, different content: the caller owns invalidation
+        changed = self._asset(description="Changed")
+        assert compute_asset_hash_cached(changed, key) == first
+
+    def test_new_key_recomputes(self):
+        """A different key should compute a fresh hash."""
+        asset = self._asset()
+        changed = self._asset(description="Changed")
+
+        first = compute_asset_hash_cached(asset, ("test.table", "t1"))
+        second = compute_asset_hash_cached(changed, ("test.table", "t2"))
+
+        assert first != second
+
+    def test_clear_hash_cache(self):
+        """clear_hash_cache should drop memoized entries."""
+        key = ("test.table", "t1")
+        compute_asset_hash_cached(self._asset(), key)
+        clear_hash_cache()
+
+        changed = self._asset(description="Changed")
+        assert compute_asset_hash_cached(changed, key) == compute_asset_hash(changed)
+
+    def test_cache_is_bounded(self):
+        """The cache should evict least recently used entries."""
+        with patch.object(hasher, "_HASH_CACHE_MAXSIZE", 2):
+            for i in range(3):
+                compute_asset_hash_cached(self._asset(), ("test.table", i))
+
+        assert len(hasher._hash_cache) == 2
+        assert ("test.table", 0) not in hasher._hash_cache
+
+    def test_cache_toggle_disables_memoization(self):
+        """With the cache disabled every call should recompute."""
+        key = ("test.table", "t1")
+        changed = self._asset(description="Changed")
+        with patch.object(hasher, "_HASH_CACHE_ENABLED", False):
+            compute_asset_hash_cached(self._asset(), key)
+            assert compute_asset_hash_cached(changed, key) == compute_asset_hash(changed)
+
+        assert len(hasher._hash_cache) == 0
+
+
+class TestCanonicalEncoding:
+    """Pins the canonical JSON bytes that persisted hashes depend on."""
+
+    _ASSET = {
+        "id": "synergy.sales.orders",
+        "sourceSystem": "synergy",
+        "entityType": "table",
+        "elementName": "Pedidos de Venda",
+        "entityPath": "sales.dbo.orders",
+        "description": "Pedidos confirmados — inclui cancelamentos",
+        "tags": ["Sales", "finance", "Orders"],
+        "columns": [
+            {"name": "order_total", "type": "decimal", "scale": 1e-05},
+            {"name": "order_id", "type": "int", "maxValue": 1e16},
+        ],
+        "relationships": [{"id": "rel.customer", "nullable": False}],
+        "lastUpdated": "2026-01-24T10:00:00Z",
+    }
+
+    def test_canonical_json_bytes_are_stable(self):
+        """Serializer output must not drift (float spelling, UTF-8, key order)."""
+        expected = (
+            '{"columns":[{"maxValue":1e+16,"name":"order_id","type":"int"},'
+            '{"name":"order_total","scale":1e-05,"type":"decimal"}],'
+            '"description":"Pedidos confirmados — inclui cancelamentos",'
+            '"elementName":"Pedidos de Venda","entityPath":"sales.dbo.orders",'
+            '"entityType":"table","id":"synergy.sales.orders",'
+            '"relationships":[{"id":"rel.customer","nullable":false}],'
+            '"sourceSystem":"synergy","tags":["finance","Orders","Sales"]}'
+        ).encode("utf-8")
+
+        assert hasher._to_canonical_json(normalize_asset(self._ASSET)) == expected
+
+    def test_golden_hash(self):
+        """A known asset must keep its known hash across releases."""
+        clear_hash_cache()
+        assert compute_asset_hash(self._ASSET) == (
+            "522976fd4ec766c13c4228e9477dec278669c6479f840706e653a13d63e608d4"
+        )
 
 
 class TestEdgeCases:
@@ -635,24 +776,18 @@ class TestEdgeCases:
 
         hash_value = compute_asset_hash(asset)
 
-        assert len(hash_value) == 64
-        assert all(c in "0123456789abcdef" for c in hash_value)
+        assert _HEX64(hash_value)
+
+    def test_asset_types_match_field_sets(self):
+        """The TypedDict shapes should declare exactly the contract's fields."""
+        assert set(NormalizedAsset.__annotations__) == get_material_fields()
+        assert set(AssetMetadata.__annotations__) == (
+            get_material_fields() | get_volatile_fields()
+        )
 
     def test_get_asset_hash_components(self):
         """get_asset_hash_components should return normalized form."""
-        asset = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "tags": ["z", "a"],
-            "lastUpdated": "2026-01-24T10:00:00Z",
-        }
+        asset = _asset(tags=["z", "a"], lastUpdated="2026-01-24T10:00:00Z")
 
         components = get_asset_hash_components(asset)
 
@@ -662,36 +797,22 @@ class TestEdgeCases:
 
     def test_empty_tags_handled(self):
         """Empty tags array should be handled correctly."""
-        asset = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "tags": [],
-        }
+        asset = _asset(tags=[])
 
         normalized = normalize_asset(asset)
 
         assert normalized["tags"] == []
 
+    def test_empty_values_are_material(self):
+        """Empty strings and collections are kept, so they change the hash."""
+        base = _asset()
+        with_empty = dict(base, tags=[], columns=[], dataType="")
+
+        assert compute_asset_hash(with_empty) != compute_asset_hash(base)
+
     def test_single_field_asset(self):
         """Should handle minimal assets with only required fields."""
-        asset = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-        }
+        asset = _asset()
 
         hash_value = compute_asset_hash(asset)
 
@@ -699,72 +820,32 @@ class TestEdgeCases:
 
     def test_normalize_error_on_invalid_tags_type(self):
         """Should raise TypeError if tags is not a list."""
-        asset = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "tags": "invalid_string",
-        }
+        asset = _asset(tags="invalid_string")
 
         with pytest.raises(TypeError):
             normalize_asset(asset)
 
     def test_normalize_error_on_invalid_columns_type(self):
         """Should raise TypeError if columns is not a list."""
-        asset = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "columns": "invalid_string",
-        }
+        asset = _asset(columns="invalid_string")
 
         with pytest.raises(TypeError):
             normalize_asset(asset)
 
     def test_normalize_error_on_column_without_name(self):
         """Should raise ValueError if column lacks name field."""
-        asset = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "columns": [{"type": "string"}],  # Missing name
-        }
+        asset = _asset(
+            columns=[{"type": "string"}],  # Missing name
+        )
 
         with pytest.raises(ValueError):
             normalize_asset(asset)
 
     def test_normalize_error_on_relationship_without_id(self):
         """Should raise ValueError if relationship lacks id field."""
-        asset = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "relationships": [{"type": "parent"}],  # Missing id
-        }
+        asset = _asset(
+            relationships=[{"type": "parent"}],  # Missing id
+        )
 
         with pytest.raises(ValueError):
             normalize_asset(asset)
@@ -775,36 +856,49 @@ class TestConsistency:
 
     def test_hash_is_deterministic(self):
         """Hash of same asset computed multiple times should be identical."""
-        asset = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-        }
+        asset = _asset()
 
         hashes = [compute_asset_hash(asset) for _ in range(5)]
 
         assert len(set(hashes)) == 1  # All hashes should be identical
 
+    def test_batch_hash_is_deterministic(self):
+        """Batch hashing of repeated and reordered inputs should be consistent."""
+        asset = _asset(tags=["z", "a", "m"])
+        reordered = {**asset, "tags": ["m", "z", "a"], "lastUpdated": "2026-01-24T10:00:00Z"}
+        changed = {**asset, "description": "Test Updated"}
+
+        hashes = compute_asset_hashes([asset, reordered, changed] * 5)
+
+        assert len(set(hashes[0::3] + hashes[1::3])) == 1
+        assert len(set(hashes[2::3])) == 1
+        assert hashes[0] != hashes[2]
+
+    def test_low_cardinality_fields_are_interned(self):
+        """Repeated low-cardinality values should share one object."""
+        # Build the strings at runtime so they are not compile-time constants
+        raw1 = _asset(
+            sourceSystem="".join(["syn", "ergy"]),
+            entityType="".join(["ta", "ble"]),
+            domain="".join(["Sa", "les"]),
+            dataType="".join(["vi", "ew"]),
+        )
+        raw2 = _asset(
+            sourceSystem="".join(["syne", "rgy"]),
+            entityType="".join(["tab", "le"]),
+            domain="".join(["Sal", "es"]),
+            dataType="".join(["v", "iew"]),
+        )
+        a = normalize_asset(raw1)
+        b = normalize_asset(raw2)
+
+        for field in ("sourceSystem", "entityType", "domain", "dataType"):
+            assert raw1[field] is not raw2[field]
+            assert a[field] is b[field]
+
     def test_normalization_is_deterministic(self):
         """Normalization of same asset multiple times should be identical."""
-        asset = {
-            "id": "test.table",
-            "sourceSystem": "synergy",
-            "entityType": "table",
-            "elementName": "Test",
-            "entityPath": "path",
-            "description": "Test",
-            "businessMeaning": "Test",
-            "domain": "Test",
-            "content": "Test",
-            "tags": ["z", "a", "m"],
-        }
+        asset = _asset(tags=["z", "a", "m"])
 
         normalized_list = [normalize_asset(asset) for _ in range(5)]
 
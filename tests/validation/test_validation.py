@@ -1,7 +1,15 @@
 import pytest
 
+from src.domain.validation import semantic_validator
+from src.domain.validation.models import Suggestion
 from src.domain.validation.structural_validator import validate_structural
-from src.domain.validation.semantic_validator import validate_semantic
+from src.domain.validation.validator import _validate_output
+from src.domain.validation.semantic_validator import (
+    FORBIDDEN_LANGUAGE,
+    FORBIDDEN_PHRASES,
+    validate_semantic,
+    validate_semantic_batch,
+)
 
 
 def test_valid_output_passes_both_layers():
@@ -29,6 +37,11 @@ def test_valid_output_passes_both_layers():
     sem_result = validate_semantic(parsed)
     assert sem_result.is_valid, sem_result.semantic_errors
 
+    # The engine hands back the dict it parsed, which is the same as the one above
+    struct_once, sem_once, parsed_once = _validate_output(yaml_text)
+    assert parsed_once == parsed
+    assert (struct_once, sem_once) == (struct_result, sem_result)
+
 
 def test_structural_accepts_indented_array_items():
     yaml_text = (
@@ -88,6 +101,10 @@ def test_structurally_valid_but_semantically_invalid():
     assert not sem_result.is_valid
     assert any("trivially generic" in e for e in sem_result.semantic_errors)
 
+    _, sem_once, parsed_once = _validate_output(yaml_text)
+    assert parsed_once == parsed
+    assert sem_once == sem_result
+
 
 def test_multiple_semantic_failures():
     parsed = {
@@ -101,3 +118,161 @@ def test_multiple_semantic_failures():
     assert any("forbidden concepts" in e for e in sem_result.semantic_errors)
     assert any("confidence must be one of" in e for e in sem_result.semantic_errors)
     assert any("forbidden source identifiers" in e for e in sem_result.semantic_errors)
+
+
+_CONCEPT_ERROR = "suggested_description references forbidden concepts (LLM/prompt/system)"
+_LANGUAGE_ERROR = "suggested_description uses speculative or disallowed phrasing (forbidden concepts)"
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [(p, _CONCEPT_ERROR) for p in FORBIDDEN_PHRASES]
+    + [(p, _LANGUAGE_ERROR) for p in FORBIDDEN_LANGUAGE],
+)
+@pytest.mark.parametrize("suffix", ["here.", "here, réel."], ids=["ascii", "non-ascii"])
+def test_every_word_level_rule_is_enforced(pattern, expected, suffix):
+    # Turn each rule back into a plain phrase and embed it in a description
+    phrase = pattern.replace(r"\b", "").replace(r"\s+", " ")
+    parsed = {
+        "suggested_description": f"Quarterly revenue table, {phrase.upper()} {suffix}",
+        "confidence": "high",
+        "used_sources": ["q1-2025-report.pdf, Page 2"],
+    }
+    sem_result = validate_semantic(parsed)
+    assert sem_result.semantic_errors == [expected]
+
+
+def test_fast_fail_reports_cheapest_failure_first():
+    parsed = {
+        "suggested_description": "Based on my knowledge, this appears to be a report",
+        "confidence": "very_high",
+        "used_sources": ["general knowledge", "internet"],
+    }
+    full = validate_semantic(parsed)
+    fast = validate_semantic(parsed, fast_fail=True)
+    assert not fast.is_valid
+    assert fast.semantic_errors == ["confidence must be one of: low, medium, high"]
+    assert fast.semantic_errors[0] in full.semantic_errors
+
+    parsed["confidence"] = "high"
+    full = validate_semantic(parsed)
+    fast = validate_semantic(parsed, fast_fail=True)
+    assert fast.semantic_errors == [e for e in full.semantic_errors if e.startswith("suggested_description")]
+
+    parsed["suggested_description"] = "Quarterly revenue summary for 2025."
+    parsed["confidence"] = "high"
+    fast = validate_semantic(parsed, fast_fail=True)
+    assert fast.semantic_errors == ["used_sources[0] references forbidden source identifiers"]
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"confidence": "maybe"},
+        {"suggested_description": "   "},
+        {"suggested_description": "Too short"},
+        {"suggested_description": "Quarterly revenue summary. " * 20},
+        {"used_sources": "q1-2025-report.pdf"},
+        {"used_sources": []},
+        {"used_sources": ["q1-2025-report.pdf", " "]},
+    ],
+)
+def test_fast_fail_matches_full_run_on_cheap_rules(overrides):
+    parsed = {
+        "suggested_description": "Quarterly revenue summary for 2025.",
+        "confidence": "high",
+        "used_sources": ["q1-2025-report.pdf, Page 2"],
+        **overrides,
+    }
+    full = validate_semantic(parsed)
+    assert len(full.semantic_errors) == 1
+    assert validate_semantic(parsed, fast_fail=True) == full
+
+
+def test_memoized_results_are_independent_per_call():
+    yaml_text = (
+        "suggested_description: \"Customer satisfaction dashboard with monthly trends.\"\n"
+        "confidence: maybe\n"
+        "used_sources:\n"
+        "- Document: csat.pdf, Page 2\n"
+    )
+    first = validate_structural(yaml_text)
+    first.structural_errors.append("mutated by caller")
+    assert validate_structural(yaml_text).structural_errors == []
+
+    parsed = {
+        "suggested_description": "Customer satisfaction dashboard with monthly trends.",
+        "confidence": "maybe",
+        "used_sources": ["Document: csat.pdf, Page 2"],
+    }
+    first = validate_semantic(parsed)
+    first.semantic_errors.clear()
+    assert validate_semantic(parsed).semantic_errors == ["confidence must be one of: low, medium, high"]
+
+
+def test_semantic_cache_does_not_conflate_source_container_types():
+    parsed = {
+        "suggested_description": "Customer satisfaction dashboard with monthly trends.",
+        "confidence": "high",
+        "used_sources": ["Document: csat.pdf, Page 2"],
+    }
+    assert validate_semantic(parsed).is_valid
+    parsed["used_sources"] = ("Document: csat.pdf, Page 2",)
+    assert validate_semantic(parsed).semantic_errors == ["used_sources must be a non-empty array"]
+
+
+def test_semantic_cache_skips_over_long_descriptions():
+    desc = "Customer satisfaction dashboard with monthly trends. " * 20
+    parsed = {
+        "suggested_description": desc,
+        "confidence": "high",
+        "used_sources": ["Document: csat.pdf, Page 2"],
+    }
+    semantic_validator._semantic_errors_cached.cache_clear()
+    errors = validate_semantic(parsed).semantic_errors
+    suggestion_errors = validate_semantic(Suggestion.from_parsed(parsed)).semantic_errors
+    assert semantic_validator._semantic_errors_cached.cache_info().currsize == 0
+    assert errors == suggestion_errors == ["suggested_description is too long (max 500 chars)"]
+
+
+def test_semantic_accepts_suggestion_model():
+    parsed = {
+        "suggested_description": "Based on my knowledge, this is a customer satisfaction dashboard.",
+        "confidence": "high",
+        "used_sources": ["Document: csat.pdf, Page 2"],
+        "warnings": [],
+    }
+    suggestion = Suggestion.from_parsed(parsed)
+    assert suggestion.to_dict() == parsed
+    assert validate_semantic(suggestion) == validate_semantic(parsed)
+    assert validate_semantic(suggestion, fast_fail=True) == validate_semantic(parsed, fast_fail=True)
+
+
+def test_suggestion_rejects_mistyped_fields():
+    with pytest.raises(TypeError):
+        Suggestion("Customer satisfaction dashboard.", "high", ["Document: csat.pdf"])
+    with pytest.raises(TypeError):
+        Suggestion.from_parsed(
+            {"suggested_description": "Dashboard.", "confidence": "high", "used_sources": "csat.pdf"}
+        )
+
+
+def test_semantic_batch_matches_single_validation():
+    good = {
+        "suggested_description": "Customer satisfaction dashboard with monthly trends.",
+        "confidence": "medium",
+        "used_sources": ["Document: csat.pdf, Page 2"],
+    }
+    bad = {
+        "suggested_description": "Based on my knowledge, this appears to be a report",
+        "confidence": "very_high",
+        "used_sources": ["general knowledge"],
+    }
+    items = [good, bad, Suggestion.from_parsed(good), bad]
+    assert validate_semantic_batch(items) == [validate_semantic(item) for item in items]
+    assert validate_semantic_batch(items, fast_fail=True) == [
+        validate_semantic(item, fast_fail=True) for item in items
+    ]
+    assert validate_semantic_batch([]) == []
+    with pytest.raises(TypeError):
+        validate_semantic_batch(good)